@@ -0,0 +1 @@
+"""Benchmarks for the season pipeline; see benchmarks/run.py."""
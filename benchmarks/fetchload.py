@@ -0,0 +1,189 @@
+"""Load-test the fetch path against the local stand-in server.
+
+    python -m benchmarks.fetchload                          # all scenarios, results/fetch-<commit>-<time>.json
+    python -m benchmarks.fetchload --scenario errors-429 --downloads 100 --output -
+    python -m benchmarks.fetchload --pages recordings/      # replay pages recorded with prefetch --record
+
+Every scenario serves the same pages (synthetic ones unless ``--pages`` is
+given) from a ``StandInServer`` with its own ``Faults`` and downloads them
+through one ``Fetcher``, the way the prefetcher does, with the rate limit
+lifted so only the fetch path itself is timed:
+
+* ``baseline``     no faults
+* ``latency``      50-100 ms added to every page
+* ``errors-429``   one page in five answered 429 with a one second Retry-After, so backoff cost shows up
+* ``errors-403``   one page in five answered 403
+* ``truncated``    one page in five cut off halfway through
+* ``concurrent``   eight downloads at a time
+* ``concurrent-latency``  eight at a time with 50-100 ms latency
+
+Faults are drawn from a seeded generator, so runs are repeatable.  For each
+scenario the per-download latency (p50, p95, max), throughput, failures,
+retries and the fetcher's counters are written as JSON.
+"""
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fixtures import write_pages
+from benchmarks.run import RESULTS_DIR, git_commit
+from nfldeepdive.fetch import Fetcher
+from nfldeepdive.instrument import Trace, activate
+from nfldeepdive.ratelimit import TokenBucket
+from nfldeepdive.standin import Faults, StandInServer, season_years
+
+SCENARIOS = {
+    "baseline": dict(),
+    "latency": dict(faults=dict(latency=0.05, jitter=0.05)),
+    "errors-429": dict(faults=dict(error_rate=0.2, error_status=429, retry_after=1)),
+    "errors-403": dict(faults=dict(error_rate=0.2, error_status=403)),
+    "truncated": dict(faults=dict(truncate_rate=0.2)),
+    "concurrent": dict(threads=8),
+    "concurrent-latency": dict(threads=8, faults=dict(latency=0.05, jitter=0.05)),
+}
+
+# Synthetic seasons served when no --pages directory is given
+SYNTHETIC_YEARS = range(1995, 2025)
+
+# Effectively no rate limit: the stand-in is local
+UNLIMITED_PER_MINUTE = 1e9
+
+# Counters summed over every download of a scenario
+COUNTERS = ("http_requests", "retries", "http_403", "http_429", "truncated_pages", "request_errors", "backoff_ms")
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def download(fetcher, year):
+    """(seconds, counters, error) for one download, traced on this thread"""
+    trace = Trace(f"download {year}")
+    error = None
+    with activate(trace):
+        start = time.perf_counter()
+        try:
+            table, rows = fetcher.download_table(year)
+            if not rows:
+                error = "no rows"
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        seconds = time.perf_counter() - start
+    return seconds, trace.counters, error
+
+
+def run_scenario(name, params, pages_dir, years, downloads, seed):
+    threads = params.get("threads", 1)
+    faults = Faults(seed=seed, **params["faults"]) if "faults" in params else None
+    schedule = [years[i % len(years)] for i in range(downloads)]
+    with StandInServer(pages_dir, faults=faults) as server:
+        fetcher = Fetcher(server.base_url, TokenBucket(UNLIMITED_PER_MINUTE, burst=threads), pool_size=threads)
+        fetcher.warm_up()
+        started = time.perf_counter()
+        if threads == 1:
+            results = [download(fetcher, year) for year in schedule]
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                results = list(pool.map(lambda year: download(fetcher, year), schedule))
+        elapsed = time.perf_counter() - started
+        served = len(server.requests)
+
+    latencies = [seconds for seconds, _, error in results if error is None]
+    counters = {key: sum(c.get(key, 0) for _, c, _ in results) for key in COUNTERS}
+    failures = {}
+    for _, _, error in results:
+        if error is not None:
+            failures[error] = failures.get(error, 0) + 1
+    return {
+        "scenario": name,
+        "params": params,
+        "threads": threads,
+        "downloads": downloads,
+        "succeeded": len(latencies),
+        "failures": failures,
+        "seconds": elapsed,
+        "per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "latency": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "max": max(latencies),
+            "mean": sum(latencies) / len(latencies),
+        } if latencies else None,
+        "server_requests": served,
+        "counters": counters,
+    }
+
+
+def print_summary(results):
+    print(f"{'scenario':<20} {'ok':>5} {'fail':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'per s':>7} {'retries':>7}",
+          file=sys.stderr)
+    for r in results:
+        lat = r["latency"] or {"p50": math.nan, "p95": math.nan, "max": math.nan}
+        print(f"{r['scenario']:<20} {r['succeeded']:>5} {r['downloads'] - r['succeeded']:>5} "
+              f"{lat['p50'] * 1000:>8.1f} {lat['p95'] * 1000:>8.1f} {lat['max'] * 1000:>8.1f} "
+              f"{r['per_second']:>7.1f} {r['counters']['retries']:>7}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the fetch path against the local stand-in server.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default all)")
+    parser.add_argument("--downloads", type=int, default=60, help="downloads per scenario (default %(default)s)")
+    parser.add_argument("--pages", metavar="DIR", help="serve pages or recordings from DIR instead of synthetic pages")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the injected faults (default %(default)s)")
+    parser.add_argument("--output", help="results file, or - for standard output "
+                                         "(default results/fetch-<commit>-<time>.json)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pages_dir = args.pages
+        if pages_dir is None:
+            pages_dir = tmp
+            write_pages(pages_dir, SYNTHETIC_YEARS)
+        years = season_years(pages_dir)
+        if not years:
+            parser.error(f"no season pages or recordings in {pages_dir}")
+
+        results = []
+        for name in args.scenario or SCENARIOS:
+            print(f"{name}...", file=sys.stderr, flush=True)
+            results.append(run_scenario(name, SCENARIOS[name], pages_dir, years, args.downloads, args.seed))
+    print_summary(results)
+
+    commit = git_commit()
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pages": args.pages or "synthetic",
+        "seed": args.seed,
+        "results": results,
+    }
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        path = args.output
+        if path is None:
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+            stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(RESULTS_DIR, f"fetch-{commit or 'unknown'}-{stamp}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        print(f"Wrote {path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Synthetic Pro-Football-Reference season pages.
+
+The pages follow the markup of the real ``/years/<year>/passing.htm`` pages
+closely enough to exercise the same code paths: page chrome before and after
+the table, other tables (some commented out, as PFR does), ``data-stat``
+header cells, repeated header rows every 30 players, linked names and teams,
+and multi-team players listed as a ``2TM``/``3TM`` total followed by one row
+per team.  The column layout follows the season's era:
+
+* up to 1977 there are no first-down and success-rate columns;
+* 1978-2005 have them, with an empty QBR column;
+* from 2006 on QBR is filled in.
+
+Everything is derived from a seeded ``random.Random``, so a given set of
+arguments always produces the same page.
+"""
+import os
+import random
+
+COLUMNS_2006 = (
+    "ranker", "player", "age", "team", "pos", "g", "gs", "qb_rec", "pass_cmp", "pass_att", "pass_cmp_pct",
+    "pass_yds", "pass_td", "pass_td_pct", "pass_int", "pass_int_pct", "pass_first_down", "pass_success",
+    "pass_long", "pass_yds_per_att", "pass_adj_yds_per_att", "pass_yds_per_cmp", "pass_yds_per_g",
+    "pass_rating", "qbr", "pass_sacked", "pass_sacked_yds", "pass_sacked_pct", "pass_net_yds_per_att",
+    "pass_adj_net_yds_per_att", "comebacks", "gwd", "av",
+)
+COLUMNS_1978 = COLUMNS_2006
+COLUMNS_1977 = tuple(c for c in COLUMNS_2006 if c not in ("pass_first_down", "pass_success"))
+
+# One representative season per era layout
+ERA_YEARS = {"1950-1977": 1970, "1978-2005": 1990, "2006-": 2015}
+
+TEAMS = (
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GNB", "HOU", "IND", "JAX", "KAN",
+    "LVR", "LAC", "LAR", "MIA", "MIN", "NWE", "NOR", "NYG", "NYJ", "PHI", "PIT", "SFO", "SEA", "TAM", "TEN", "WAS",
+)
+FIRST_NAMES = ("Joe", "Dan", "Tom", "Peyton", "Drew", "Brett", "John", "Steve", "Troy", "Jim", "Ken", "Fran", "Sonny")
+LAST_NAMES = ("Montana", "Marino", "Brady", "Manning", "Brees", "Favre", "Elway", "Young", "Aikman", "Kelly",
+              "Stabler", "Tarkenton", "Jurgensen", "Unitas", "Starr", "Griese", "Fouts", "Bradshaw")
+
+HEADER_ROW_EVERY = 30
+
+
+def era_columns(year):
+    if year <= 1977:
+        return COLUMNS_1977
+    return COLUMNS_1978 if year < 2006 else COLUMNS_2006
+
+
+def header_row(columns):
+    cells = "".join(
+        f'<th aria-label="{c}" data-stat="{c}" scope="col" class=" poptip sort_default_asc center">{c}</th>'
+        for c in columns
+    )
+    return f"<tr >{cells}</tr>"
+
+
+def player_stats(r, year, games):
+    att = r.randint(1, 650)
+    cmp_ = int(att * r.uniform(0.45, 0.7))
+    yds = int(att * r.uniform(4.5, 8.5))
+    td = r.randint(0, max(1, att // 14))
+    ints = r.randint(0, max(1, att // 20))
+    sacked = r.randint(0, 50)
+    return {
+        "age": str(r.randint(21, 40)), "pos": "QB", "g": str(games), "gs": str(r.randint(0, games)),
+        "qb_rec": f"{r.randint(0, games)}-{r.randint(0, games)}-0",
+        "pass_cmp": str(cmp_), "pass_att": str(att), "pass_cmp_pct": f"{100 * cmp_ / att:.1f}",
+        "pass_yds": str(yds), "pass_td": str(td), "pass_td_pct": f"{100 * td / att:.1f}",
+        "pass_int": str(ints), "pass_int_pct": f"{100 * ints / att:.1f}",
+        "pass_first_down": str(cmp_ * 2 // 3), "pass_success": f"{r.uniform(30, 55):.1f}",
+        "pass_long": str(r.randint(10, 99)), "pass_yds_per_att": f"{yds / att:.1f}",
+        "pass_adj_yds_per_att": f"{yds / att - 0.4:.1f}", "pass_yds_per_cmp": f"{yds / max(cmp_, 1):.1f}",
+        "pass_yds_per_g": f"{yds / games:.1f}", "pass_rating": f"{r.uniform(40, 120):.1f}",
+        "qbr": f"{r.uniform(15, 85):.1f}" if year >= 2006 else "",
+        "pass_sacked": str(sacked), "pass_sacked_yds": str(sacked * 7), "pass_sacked_pct": f"{r.uniform(2, 12):.1f}",
+        "pass_net_yds_per_att": f"{yds / att - 0.6:.2f}", "pass_adj_net_yds_per_att": f"{yds / att - 0.9:.2f}",
+        "comebacks": str(r.randint(0, 5)), "gwd": str(r.randint(0, 6)), "av": str(r.randint(0, 20)),
+    }
+
+
+def player_row(columns, rank, name, slug, team, stats):
+    cells = [f'<th scope="row" class="right " data-stat="ranker" csk="{rank}" >{rank}</th>']
+    for c in columns[1:]:
+        if c == "player":
+            value = f'<a href="/players/{slug[0]}/{slug}.htm">{name}</a>*'
+            cells.append(f'<td class="left " data-append-csv="{slug}" data-stat="player" csk="{name}" >{value}</td>')
+        elif c == "team":
+            value = team if team.endswith("TM") else f'<a href="/teams/{team.lower()}/2000.htm" title="{team}">{team}</a>'
+            cells.append(f'<td class="left " data-stat="team" >{value}</td>')
+        else:
+            value = stats.get(c, "")
+            if c == "pass_yds" and len(value) > 3:
+                value = f"{int(value):,}"
+            cells.append(f'<td class="right " data-stat="{c}" >{value}</td>')
+    return "<tr >" + "".join(cells) + "</tr>\n"
+
+
+def filler(r, size):
+    """Page chrome: navigation, commented-out secondary tables and footer text"""
+    parts = []
+    total = 0
+    while total < size:
+        n = r.randint(5, 15)
+        rows = "".join(f"<tr><td>{r.choice(TEAMS)}</td><td>{r.randint(0, 999)}</td></tr>" for _ in range(n))
+        block = (
+            f'<div class="section_wrapper" id="all_other_{total}"><div class="section_heading"><h2>Other</h2></div>'
+            f'<div class="placeholder"></div><!--\n<table class="stats_table" id="other_{total}">{rows}</table>\n-->'
+            f'<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p></div>\n'
+        )
+        parts.append(block)
+        total += len(block)
+    return "".join(parts)
+
+
+def passing_page(year, players=100, multi_team_every=17, chrome_kb=250, seed=None):
+    """HTML of a synthetic season page.
+
+    ``players`` distinct passers are listed; every ``multi_team_every``-th one
+    (0 for none) played for two or three teams.  ``chrome_kb`` is the
+    approximate amount of markup before and after the table.
+    """
+    r = random.Random(f"{year}:{players}:{multi_team_every}:{chrome_kb}" if seed is None else seed)
+    columns = era_columns(year)
+    out = [
+        f"<!DOCTYPE html><html data-version=\"klecko-\" lang=\"en\"><head><title>{year} NFL Passing | "
+        "Pro-Football-Reference.com</title></head><body><div id=\"wrap\">",
+        filler(r, chrome_kb * 1024 // 2),
+        '<div class="table_container" id="div_passing">',
+        '<table class="per_match_toggle sortable stats_table" id="passing" data-cols-to-freeze=",2">',
+        f"<caption>{year} Passing Table</caption><colgroup>{'<col>' * len(columns)}</colgroup>",
+        "<thead>", header_row(columns), "</thead><tbody>",
+    ]
+    rank = 0
+    for i in range(players):
+        if i and i % HEADER_ROW_EVERY == 0:
+            out.append(header_row(columns).replace("<tr >", '<tr class="thead">', 1))
+        rank += 1
+        name = f"{r.choice(FIRST_NAMES)} {r.choice(LAST_NAMES)} {i}"
+        slug = f"{name.split()[1][:4]}{name.split()[0][:2]}{i:02d}"
+        games = r.randint(1, 17 if year >= 2021 else 16 if year >= 1978 else 14)
+        if multi_team_every and i % multi_team_every == multi_team_every - 1:
+            teams = r.sample(TEAMS, 3 if i % 2 else 2)
+            out.append(player_row(columns, rank, name, slug, f"{len(teams)}TM", player_stats(r, year, games)))
+            for team in teams:
+                out.append(player_row(columns, rank, name, slug, team, player_stats(r, year, games)))
+        else:
+            out.append(player_row(columns, rank, name, slug, r.choice(TEAMS), player_stats(r, year, games)))
+    out.append("</tbody><tfoot></tfoot></table></div>")
+    out.append(filler(r, chrome_kb * 1024 // 2))
+    out.append("</div></body></html>")
+    return "".join(out)
+
+
+def write_pages(directory, years, **kwargs):
+    """Write ``passing_<year>.html`` for each year, e.g. for the stand-in server"""
+    os.makedirs(directory, exist_ok=True)
+    for year in years:
+        with open(os.path.join(directory, f"passing_{year}.html"), "w", encoding="utf-8") as f:
+            f.write(passing_page(year, **kwargs))
@@ -0,0 +1,220 @@
+"""Time every stage of loading a season on synthetic pages.
+
+    python -m benchmarks.run                       # all scenarios, results/<commit>-<time>.json
+    python -m benchmarks.run --scenario 2006- --repeat 20 --output -
+    python -m benchmarks.run --compare benchmarks/results/old.json
+
+Stages, in pipeline order:
+
+* ``extract``  streaming the page through PassingTableParser
+* ``players``  the compiled era schema's column mapping, number parsing and multi-team merging
+  into PlayerSeason records
+* ``season``   building the typed columns from the records
+* ``zscores``  the NumPy z-score engine
+* ``store``    encoding and decoding the binary parsed cache
+* ``model``    building the TableModel (every player, not just the top 40)
+* ``render``   formatting every row for display
+* ``treeview`` inserting every row into a ttk.Treeview, and ``virtual_table``
+  showing the model in the app's VirtualTable (only when Tk has a display)
+
+Each stage is run ``--repeat`` times on the output of the previous stage and
+its min, median and mean wall time are written as JSON together with the
+commit, Python and NumPy versions, so runs can be compared across commits.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.fixtures import ERA_YEARS, passing_page
+from nfldeepdive.parser import CHUNK_SIZE, PassingTableParser
+from nfldeepdive.pipeline import extract_players
+from nfldeepdive.season import Season
+from nfldeepdive.stats import score_season
+from nfldeepdive.store import decode_season, encode_season
+from nfldeepdive.tablemodel import season_model
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+SCENARIOS = {
+    "1950-1977": dict(year=ERA_YEARS["1950-1977"], players=100),
+    "1978-2005": dict(year=ERA_YEARS["1978-2005"], players=100),
+    "2006-": dict(year=ERA_YEARS["2006-"], players=100),
+    # Far more rows and page chrome than any real season
+    "oversized": dict(year=ERA_YEARS["2006-"], players=3000, chrome_kb=2000),
+    # Every other passer played for two or three teams
+    "multi-team": dict(year=ERA_YEARS["1978-2005"], players=1000, multi_team_every=2),
+}
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times), "mean": statistics.fmean(times)}
+
+
+def extract(page):
+    parser = PassingTableParser()
+    rows = []
+    for start in range(0, len(page), CHUNK_SIZE):
+        rows.extend(parser.feed(page[start:start + CHUNK_SIZE]))
+        if parser.done:
+            break
+    return parser.header, rows
+
+
+def tk_root():
+    """A hidden Tk root, or None when there is no display"""
+    try:
+        import tkinter
+        root = tkinter.Tk()
+    except Exception:
+        return None
+    root.withdraw()
+    return root
+
+
+def treeview_stages(root, model, repeat):
+    from tkinter import ttk
+
+    from nfldeepdive.app import VirtualTable
+    from nfldeepdive.tablemodel import ALL_SEASON_COLUMNS
+
+    rows = model.display_rows()
+
+    def insert_all():
+        tree = ttk.Treeview(root, columns=model.columns, show="headings")
+        for row in rows:
+            tree.insert("", "end", values=row)
+        root.update_idletasks()
+        tree.destroy()
+
+    table = VirtualTable(root, ALL_SEASON_COLUMNS, {})
+
+    def show_virtual():
+        table.set_model(model)
+        root.update_idletasks()
+
+    return {"treeview": timed(insert_all, repeat), "virtual_table": timed(show_virtual, repeat)}
+
+
+def run_scenario(name, params, repeat, root=None):
+    year = params["year"]
+    page = passing_page(**params)
+
+    header, rows = extract(page)
+    players = extract_players(rows, year, header)
+    season = Season.from_records(year, players)
+    model = season_model(season, len(season))
+
+    stages = {
+        "extract": timed(lambda: extract(page), repeat),
+        "players": timed(lambda: extract_players(rows, year, header), repeat),
+        "season": timed(lambda: Season.from_records(year, players), repeat),
+        "zscores": timed(lambda: score_season(season), repeat),
+        "store": timed(lambda: decode_season(encode_season(season), year), repeat),
+        "model": timed(lambda: season_model(season, len(season)), repeat),
+        "render": timed(model.display_rows, repeat),
+    }
+    if root is not None:
+        stages.update(treeview_stages(root, model, repeat))
+    return {
+        "scenario": name,
+        "params": params,
+        "page_bytes": len(page.encode("utf-8")),
+        "table_rows": len(rows),
+        "players": len(season),
+        "stages": stages,
+    }
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                               text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() + ("-dirty" if dirty else "")
+
+
+def compare(base, current):
+    """Print the change in median time per scenario and stage"""
+    base_results = {r["scenario"]: r["stages"] for r in base["results"]}
+    print(f"{'scenario':<12} {'stage':<14} {'base ms':>10} {'now ms':>10} {'change':>8}")
+    for result in current["results"]:
+        old = base_results.get(result["scenario"], {})
+        for stage, now in result["stages"].items():
+            if stage not in old:
+                continue
+            before, after = old[stage]["median"], now["median"]
+            change = (after - before) / before * 100 if before else 0.0
+            print(f"{result['scenario']:<12} {stage:<14} {before * 1000:>10.2f} {after * 1000:>10.2f} {change:>+7.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark each stage of loading a season on synthetic pages.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default all)")
+    parser.add_argument("--players", type=int, help="passers per page for the per-era scenarios (default 100)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per stage (default %(default)s)")
+    parser.add_argument("--no-tk", action="store_true", help="skip the Treeview stages even if Tk has a display")
+    parser.add_argument("--output", help="results file, or - for standard output (default results/<commit>-<time>.json)")
+    parser.add_argument("--compare", metavar="BASE", help="print the change against an earlier results file")
+    args = parser.parse_args(argv)
+
+    root = None if args.no_tk else tk_root()
+    results = []
+    for name in args.scenario or SCENARIOS:
+        params = dict(SCENARIOS[name])
+        if args.players and name in ERA_YEARS:
+            params["players"] = args.players
+        print(f"{name}...", file=sys.stderr, flush=True)
+        results.append(run_scenario(name, params, args.repeat, root))
+    if root is not None:
+        root.destroy()
+
+    commit = git_commit()
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "tk": root is not None,
+        "results": results,
+    }
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        path = args.output
+        if path is None:
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+            stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(RESULTS_DIR, f"{commit or 'unknown'}-{stamp}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        print(f"Wrote {path}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(json.load(f), report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""Core data pipeline for the NFL Stat Deepdiver."""
+import os
+
+# Pages and parsed seasons are cached next to the app, as they always have been
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
@@ -0,0 +1,5 @@
+import sys
+
+from nfldeepdive.cli import main
+
+sys.exit(main())
@@ -0,0 +1,699 @@
+"""Tkinter desktop app (``nfldeepdive gui`` or ``python passingstats.py``)."""
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+import os
+import queue
+import threading
+import time
+from contextlib import nullcontext
+
+from nfldeepdive import DEFAULT_CACHE_DIR, instrument
+from nfldeepdive.fetch import Fetcher
+from nfldeepdive.leaderboard import LeaderboardIndex
+from nfldeepdive.pipeline import Cancelled, season_table
+from nfldeepdive.prefetch import prefetch_seasons
+from nfldeepdive.season import FIRST_SEASON, LAST_SEASON, MIN_ATTEMPTS, MIN_ATTEMPTS_AFTER, TOP_N
+from nfldeepdive.tablemodel import ALL_SEASON_COLUMNS, TableModel, season_columns
+
+# How often the Tk thread checks the worker results queue
+POLL_INTERVAL_MS = 50
+
+# Results-queue id used by the bulk prefetch worker (single fetches use integers)
+PREFETCH = "prefetch"
+
+class NFLPassingStatsApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("NFL Passing Stats Viewer")
+        self.root.geometry("1400x600")
+        self.root.configure(bg="#f5f5f5")
+        
+        # Background fetch state: results come back through a queue polled with after()
+        self.cache_dir = DEFAULT_CACHE_DIR
+        self.results = queue.Queue()
+        self.request_id = 0
+        self.cancel_event = None
+        self.prefetch_cancel = None
+        self.polling = False
+
+        # Timings of the last load, shown on request and appended to cache/trace.jsonl
+        self.trace_log = os.path.join(self.cache_dir, instrument.TRACE_LOG)
+        self.last_trace = None
+        self.debug_panel = None
+        self.show_timings = tk.BooleanVar(value=False)
+        self.profile_next = tk.BooleanVar(value=False)
+
+        # One pooled, rate-limited session shared by every fetch and the prefetcher
+        self.fetcher = Fetcher()
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        title = tk.Label(self.root, text="NFL Passing Stats by Year", font=("Arial", 20, "bold"), bg="#f5f5f5", fg="#1d3557")
+        title.pack(pady=20)
+
+        form = tk.Frame(self.root, bg="#f5f5f5")
+        form.pack(pady=10)
+
+        tk.Label(form, text="Select Year:", font=("Arial", 12), bg="#f5f5f5").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        self.year_var = tk.StringVar()
+        self.year_combo = ttk.Combobox(form, textvariable=self.year_var, font=("Arial", 12), width=10, state="readonly")
+        self.year_combo["values"] = [str(y) for y in range(LAST_SEASON, FIRST_SEASON - 1, -1)]
+        self.year_combo.current(0)
+        self.year_combo.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        self.year_combo.bind("<<ComboboxSelected>>", self.on_year_selected)
+
+        fetch_btn = tk.Button(form, text="Fetch Stats", font=("Arial", 12, "bold"), bg="#457b9d", fg="white", relief="flat", command=self.fetch_stats)
+        fetch_btn.grid(row=0, column=2, padx=10, pady=5)
+
+        self.cancel_btn = tk.Button(form, text="Cancel", font=("Arial", 12), relief="flat", state="disabled", command=self.cancel_fetch)
+        self.cancel_btn.grid(row=0, column=3, padx=5, pady=5)
+
+        self.prefetch_btn = tk.Button(form, text="Prefetch All Seasons", font=("Arial", 12), relief="flat", command=self.toggle_prefetch)
+        self.prefetch_btn.grid(row=0, column=4, padx=5, pady=5)
+
+        leaders_btn = tk.Button(form, text="All-Time Leaders", font=("Arial", 12), relief="flat", command=self.open_leaderboard)
+        leaders_btn.grid(row=0, column=5, padx=5, pady=5)
+
+        whatif_btn = tk.Button(form, text="What-If Scoring", font=("Arial", 12), relief="flat", command=self.open_whatif)
+        whatif_btn.grid(row=0, column=6, padx=5, pady=5)
+
+        careers_btn = tk.Button(form, text="Careers", font=("Arial", 12), relief="flat", command=self.open_careers)
+        careers_btn.grid(row=0, column=7, padx=5, pady=5)
+
+        timings_check = tk.Checkbutton(form, text="Show timings", font=("Arial", 10), bg="#f5f5f5", variable=self.show_timings, command=self.toggle_timings)
+        timings_check.grid(row=0, column=8, padx=5, pady=5)
+
+        debug_btn = tk.Button(form, text="Debug", font=("Arial", 10), relief="flat", command=self.open_debug_panel)
+        debug_btn.grid(row=0, column=9, padx=5, pady=5)
+
+        # Status bar with a busy indicator while a season loads in the background
+        status_bar = tk.Frame(self.root, bg="#f5f5f5")
+        status_bar.pack(side="bottom", fill="x", padx=20, pady=(0, 10))
+        self.status_var = tk.StringVar(value="Ready")
+        tk.Label(status_bar, textvariable=self.status_var, font=("Arial", 10), bg="#f5f5f5", anchor="w").pack(side="left", fill="x", expand=True)
+        self.prefetch_var = tk.StringVar(value="")
+        tk.Label(status_bar, textvariable=self.prefetch_var, font=("Arial", 10), bg="#f5f5f5", fg="#457b9d").pack(side="right", padx=10)
+        self.progress = ttk.Progressbar(status_bar, mode="indeterminate", length=160)
+        self.progress.pack(side="right")
+        self.timing_var = tk.StringVar(value="")
+        self.timing_label = tk.Label(status_bar, textvariable=self.timing_var, font=("Arial", 10), bg="#f5f5f5", fg="#6c757d")
+
+        # Table for stats
+        self.table_frame = tk.Frame(self.root, bg="#f5f5f5")
+        self.table_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # Set column widths
+        self.column_widths = {
+            "Player": 150,
+            "Team": 80,
+            "G": 40,
+            "GS": 40,
+            "Cmp": 50,
+            "Att": 50,
+            "Cmp%": 60,
+            "Yds": 70,
+            "TD": 40,
+            "INT": 40,
+            "Y/A": 50,
+            "Y/G": 60,
+            "Rate": 60,
+            "QBR": 60,
+            "Yds Z-Score": 80,
+            "TD Z-Score": 80,
+            "Rate Z-Score": 80,
+            "QBR Z-Score": 80,
+            "Total Z-Score": 80
+        }
+
+        # One widget for every season: the era only changes which columns are displayed
+        self.table = VirtualTable(self.table_frame, ALL_SEASON_COLUMNS, self.column_widths)
+        self.table.set_columns(season_columns(LAST_SEASON))
+
+    def fetch_stats(self):
+        """Start loading the selected season on a worker thread, superseding any load in flight"""
+        year = self.year_var.get()
+
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        self.request_id += 1
+        self.cancel_event = threading.Event()
+
+        self.root.config(cursor="watch")
+        self.cancel_btn.config(state="normal")
+        self.progress.start(10)
+        self.set_status(f"Loading {year}...")
+
+        trace = instrument.Trace(f"Season {year}")
+        profile_path = None
+        if self.profile_next.get():
+            # Profiling is a one-shot: only this fetch is captured
+            self.profile_next.set(False)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            profile_path = os.path.join(self.cache_dir, "profiles", f"season_{year}_{stamp}.prof")
+            trace.profile_path = profile_path
+
+        worker = threading.Thread(
+            target=self.fetch_worker, args=(self.request_id, year, self.cancel_event, trace, profile_path), daemon=True
+        )
+        worker.start()
+        self.start_polling()
+
+    def start_polling(self):
+        if not self.polling:
+            self.polling = True
+            self.root.after(POLL_INTERVAL_MS, self.poll_results)
+
+    def fetch_worker(self, request_id, year, cancel, trace, profile_path=None):
+        """Runs off the Tk thread; everything it produces goes through the results queue"""
+        def progress(message):
+            self.results.put((request_id, "progress", f"{year}: {message}"))
+
+        profiling = instrument.profiled(profile_path) if profile_path else nullcontext()
+        try:
+            with instrument.activate(trace), profiling:
+                model = season_table(year, self.cache_dir, cancel, progress, self.fetcher)
+            # The Tk thread adds the render time and logs the trace
+            self.results.put((request_id, "done", (year, model, trace)))
+        except Cancelled:
+            trace.count("cancelled")
+            instrument.append_log(trace, self.trace_log)
+            self.results.put((request_id, "cancelled", year))
+        except Exception as e:
+            trace.count("failed")
+            instrument.append_log(trace, self.trace_log)
+            self.results.put((request_id, "error", str(e)))
+
+    def poll_results(self):
+        """Drain the results queue on the Tk thread, ignoring anything from superseded requests"""
+        try:
+            while True:
+                request_id, kind, payload = self.results.get_nowait()
+                if request_id == PREFETCH:
+                    self.handle_prefetch_result(kind, payload)
+                    continue
+                if request_id != self.request_id:
+                    continue
+                if kind == "progress":
+                    self.set_status(payload)
+                elif kind == "done":
+                    year, model, trace = payload
+                    with trace.span("render"):
+                        self.show_rows(year, model)
+                        self.root.update_idletasks()
+                    self.finish_request(f"Loaded {len(model)} passers for {year}")
+                    self.record_trace(trace)
+                elif kind == "cancelled":
+                    self.finish_request(f"Cancelled loading {payload}")
+                else:
+                    self.finish_request("Fetch failed")
+                    messagebox.showerror("Error", f"Failed to fetch stats: {payload}")
+        except queue.Empty:
+            pass
+
+        if self.cancel_event is not None or self.prefetch_cancel is not None:
+            self.root.after(POLL_INTERVAL_MS, self.poll_results)
+        else:
+            self.polling = False
+
+    def cancel_fetch(self):
+        if self.cancel_event is not None:
+            # The worker stops at its next checkpoint; anything it still sends is stale
+            self.cancel_event.set()
+            self.request_id += 1
+            self.finish_request("Cancelled")
+
+    def toggle_prefetch(self):
+        """Start or stop downloading every season into the cache in the background"""
+        if self.prefetch_cancel is not None:
+            self.prefetch_cancel.set()
+            self.prefetch_var.set("Stopping prefetch...")
+            return
+
+        self.prefetch_cancel = threading.Event()
+        self.prefetch_btn.config(text="Stop Prefetch")
+        self.prefetch_var.set("Prefetch starting...")
+        worker = threading.Thread(target=self.prefetch_worker, args=(self.prefetch_cancel,), daemon=True)
+        worker.start()
+        self.start_polling()
+
+    def prefetch_worker(self, cancel):
+        def on_progress(done, total, year, status):
+            self.results.put((PREFETCH, "progress", f"Prefetch {done}/{total}: {year} {status}"))
+
+        try:
+            summary = prefetch_seasons(
+                range(FIRST_SEASON, LAST_SEASON + 1), self.cache_dir, self.fetcher,
+                cancel=cancel, on_progress=on_progress,
+            )
+            message = (
+                f"Prefetch done: {len(summary['fetched'])} fetched, "
+                f"{len(summary['cached'])} cached, {len(summary['failed'])} failed"
+            )
+        except Cancelled:
+            message = "Prefetch stopped; it will resume where it left off"
+        except Exception as e:
+            message = f"Prefetch failed: {e}"
+        self.results.put((PREFETCH, "done", message))
+
+    def handle_prefetch_result(self, kind, message):
+        self.prefetch_var.set(message)
+        if kind == "done":
+            self.prefetch_cancel = None
+            self.prefetch_btn.config(text="Prefetch All Seasons")
+
+    def record_trace(self, trace):
+        self.last_trace = trace
+        instrument.append_log(trace, self.trace_log)
+        self.timing_var.set(trace.summary())
+        if self.debug_panel is not None:
+            self.debug_panel.show(trace)
+
+    def toggle_timings(self):
+        if self.show_timings.get():
+            self.timing_label.pack(side="right", padx=10)
+        else:
+            self.timing_label.pack_forget()
+
+    def open_debug_panel(self):
+        if self.debug_panel is None:
+            self.debug_panel = DebugPanel(self)
+        else:
+            self.debug_panel.window.lift()
+        if self.last_trace is not None:
+            self.debug_panel.show(self.last_trace)
+
+    def open_leaderboard(self):
+        LeaderboardWindow(self.root, self.cache_dir)
+
+    def open_whatif(self):
+        WhatIfWindow(self.root, self.cache_dir, self.year_var.get())
+
+    def open_careers(self):
+        CareerWindow(self.root, self.cache_dir)
+
+    def on_year_selected(self, event=None):
+        # Picking another year while a season is loading replaces that request
+        if self.cancel_event is not None:
+            self.fetch_stats()
+
+    def finish_request(self, message):
+        self.cancel_event = None
+        self.progress.stop()
+        self.cancel_btn.config(state="disabled")
+        self.root.config(cursor="")
+        self.set_status(message)
+
+    def set_status(self, message):
+        self.status_var.set(message)
+
+    def show_rows(self, year, model):
+        self.table.set_model(model)
+
+class VirtualTable:
+    """Treeview that only renders the rows currently in view.
+
+    The widget holds one item per visible line; scrolling and sorting rewrite
+    those items' values from a TableModel, so the cost of a redraw depends on
+    the window height and not on how many rows the model has.  The columns are
+    created once and switched with ``displaycolumns``.  The selection belongs to
+    a model row, not a line, so it follows that row through scrolling and sorting.
+    """
+
+    def __init__(self, parent, columns, column_widths, height=20):
+        self.columns = tuple(columns)
+        self.model = None
+        self.slots = []
+        self.items = []
+        self.top = 0
+        self.visible = height
+        self.sort_reverse = False
+        self.selected = None     # index into model.rows of the selected row
+
+        self.tree = ttk.Treeview(parent, columns=self.columns, show="headings", height=height, selectmode="browse")
+        for col in self.columns:
+            self.tree.heading(col, text=col, command=lambda c=col: self.sort_by(c))
+            self.tree.column(col, anchor="center", width=column_widths.get(col, 80))
+        self.tree.pack(fill="both", expand=True, side="left")
+
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self.visible))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self.visible))
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+
+    def set_columns(self, columns):
+        self.tree["displaycolumns"] = columns
+
+    def set_model(self, model):
+        self.model = model
+        self.slots = [self.columns.index(c) for c in model.columns]
+        self.top = 0
+        self.sort_reverse = False
+        self.selected = None
+        self.set_columns(model.columns)
+        self.render()
+
+    def render(self):
+        total = len(self.model) if self.model is not None else 0
+        count = min(self.visible, total)
+
+        # Grow or shrink the pool of items to exactly the number of visible lines
+        while len(self.items) < count:
+            self.items.append(self.tree.insert("", "end"))
+        if len(self.items) > count:
+            self.tree.delete(*self.items[count:])
+            del self.items[count:]
+
+        self.top = max(0, min(self.top, total - count))
+        blank = [""] * len(self.columns)
+        selection = []
+        for offset, item in enumerate(self.items):
+            values = list(blank)
+            for slot, text in zip(self.slots, self.model.display_row(self.top + offset)):
+                values[slot] = text
+            self.tree.item(item, values=values)
+            if self.model.order[self.top + offset] == self.selected:
+                selection.append(item)
+        # Highlight the line now showing the selected row, or none if it is out of view
+        self.tree.selection_set(selection)
+
+        if total:
+            self.scrollbar.set(self.top / total, (self.top + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def on_select(self, event=None):
+        # Redraws move or clear the highlight as well; only a selected line names a row
+        items = self.tree.selection()
+        if self.model is not None and items and items[0] in self.items:
+            self.selected = self.model.order[self.top + self.items.index(items[0])]
+
+    def scroll_by(self, lines):
+        self.top += lines
+        self.render()
+        return "break"
+
+    def on_scroll(self, action, amount, unit=None):
+        if self.model is None:
+            return
+        if action == "moveto":
+            self.top = int(float(amount) * len(self.model))
+            self.render()
+        else:
+            step = self.visible if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+    def on_wheel(self, event):
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+
+    def on_resize(self, event):
+        # Measure a real row to work out how many lines fit in the new height
+        if not self.items:
+            return
+        bbox = self.tree.bbox(self.items[0])
+        if not bbox:
+            return
+        _, header, _, row_height = bbox
+        visible = max(1, (event.height - header) // max(1, row_height))
+        if visible != self.visible:
+            self.visible = visible
+            self.render()
+
+    def sort_by(self, col):
+        """Sort by a column when its header is clicked (click again to toggle direction)"""
+        if self.model is None:
+            return
+        self.model.sort(col, self.sort_reverse)
+        self.sort_reverse = not self.sort_reverse
+        self.top = 0
+        self.render()
+
+
+class DebugPanel:
+    """Span tree, counters and (when captured) the cProfile summary of the last season load"""
+
+    def __init__(self, app):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Debug: Last Load")
+        self.window.geometry("760x520")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        controls = tk.Frame(self.window)
+        controls.pack(fill="x", padx=10, pady=5)
+        tk.Checkbutton(controls, text="Profile next fetch (cProfile)", variable=app.profile_next).pack(side="left")
+        tk.Label(controls, text=f"Log: {app.trace_log}", fg="#6c757d").pack(side="right")
+
+        self.text = tk.Text(self.window, font=("Courier", 10), wrap="none")
+        self.text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.text.insert("end", "No season loaded yet.")
+        self.text.config(state="disabled")
+
+    def show(self, trace):
+        report = trace.report()
+        if trace.profile_path and os.path.exists(trace.profile_path):
+            report += "\n\n" + instrument.profile_summary(trace.profile_path)
+        self.text.config(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.insert("end", report)
+        self.text.config(state="disabled")
+
+    def close(self):
+        self.app.debug_panel = None
+        self.window.destroy()
+
+
+class LeaderboardWindow:
+    """All-time top player-seasons across every cached season, read from the leaderboard index"""
+
+    columns = ("Rank", "Year", "Player", "Team", "Att", "Yds", "TD", "INT", "Rate", "QBR",
+               "Yds Z-Score", "TD Z-Score", "Eff Z-Score", "Total Z-Score")
+    rank_options = {
+        "Total Z-Score": "total_z",
+        "Yds Z-Score": "yds_z",
+        "TD Z-Score": "td_z",
+        "Rate/QBR Z-Score": "eff_z",
+    }
+
+    def __init__(self, root, cache_dir):
+        self.index = LeaderboardIndex(cache_dir)
+        # Pick up any parsed seasons that were cached before the index existed
+        self.index.sync(cache_dir)
+
+        self.window = tk.Toplevel(root)
+        self.window.title("All-Time Passing Leaders")
+        self.window.geometry("1200x600")
+        self.window.configure(bg="#f5f5f5")
+
+        form = tk.Frame(self.window, bg="#f5f5f5")
+        form.pack(pady=10)
+        years = [str(y) for y in range(FIRST_SEASON, LAST_SEASON + 1)]
+
+        tk.Label(form, text="From:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=0, padx=5)
+        self.start_var = tk.StringVar(value=years[0])
+        ttk.Combobox(form, textvariable=self.start_var, values=years, width=6, state="readonly").grid(row=0, column=1)
+        tk.Label(form, text="To:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=2, padx=5)
+        self.end_var = tk.StringVar(value=years[-1])
+        ttk.Combobox(form, textvariable=self.end_var, values=years, width=6, state="readonly").grid(row=0, column=3)
+
+        tk.Label(form, text="Team:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=4, padx=5)
+        self.team_var = tk.StringVar()
+        tk.Entry(form, textvariable=self.team_var, width=6).grid(row=0, column=5)
+        tk.Label(form, text="Min Att:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=6, padx=5)
+        self.min_att_var = tk.StringVar(value="0")
+        tk.Entry(form, textvariable=self.min_att_var, width=6).grid(row=0, column=7)
+        tk.Label(form, text="Top:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=8, padx=5)
+        self.limit_var = tk.StringVar(value="50")
+        tk.Entry(form, textvariable=self.limit_var, width=5).grid(row=0, column=9)
+        tk.Label(form, text="Rank by:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=10, padx=5)
+        self.rank_var = tk.StringVar(value="Total Z-Score")
+        ttk.Combobox(form, textvariable=self.rank_var, values=list(self.rank_options), width=16, state="readonly").grid(row=0, column=11)
+        tk.Button(form, text="Show", font=("Arial", 11, "bold"), bg="#457b9d", fg="white", relief="flat", command=self.refresh).grid(row=0, column=12, padx=10)
+
+        table_frame = tk.Frame(self.window, bg="#f5f5f5")
+        table_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.table = VirtualTable(table_frame, self.columns, {"Player": 150, "Rank": 50, "Year": 60}, height=20)
+
+        self.refresh()
+
+    def refresh(self):
+        try:
+            min_att = float(self.min_att_var.get() or 0)
+            limit = int(self.limit_var.get() or 50)
+        except ValueError:
+            messagebox.showerror("Error", "Min Att and Top must be numbers.", parent=self.window)
+            return
+
+        rows = self.index.top(
+            limit,
+            start=self.start_var.get(),
+            end=self.end_var.get(),
+            team=self.team_var.get().strip() or None,
+            min_attempts=min_att,
+            order_by=self.rank_options[self.rank_var.get()],
+        )
+        self.table.set_model(TableModel(self.columns, [(rank,) + tuple(row[:-1]) for rank, row in enumerate(rows, 1)]))
+
+
+class WhatIfWindow:
+    """Re-rank passers live by a weighted sum of metric z-scores over cached seasons"""
+
+    ALL_SEASONS = "All cached seasons"
+
+    def __init__(self, root, cache_dir, year=None):
+        from nfldeepdive import scoring
+
+        self.scoring = scoring
+        self.engine = scoring.ScoringEngine.from_store(cache_dir)
+
+        self.window = tk.Toplevel(root)
+        self.window.title("What-If Scoring")
+        self.window.geometry("1300x650")
+        self.window.configure(bg="#f5f5f5")
+
+        form = tk.Frame(self.window, bg="#f5f5f5")
+        form.pack(pady=10)
+        seasons = [self.ALL_SEASONS] + [str(y) for y in reversed(self.engine.years())]
+        tk.Label(form, text="Seasons:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=0, padx=5)
+        self.scope_var = tk.StringVar(value=year if year in seasons else self.ALL_SEASONS)
+        scope = ttk.Combobox(form, textvariable=self.scope_var, values=seasons, width=18, state="readonly")
+        scope.grid(row=0, column=1)
+        scope.bind("<<ComboboxSelected>>", self.refresh)
+        tk.Label(form, text="Min Att:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=2, padx=5)
+        # Applies from 1971 on, as in the leaderboard; lowering it brings low-volume passers in too
+        self.min_att_var = tk.StringVar(value=str(MIN_ATTEMPTS))
+        tk.Spinbox(form, textvariable=self.min_att_var, from_=0, to=800, increment=25, width=6).grid(row=0, column=3)
+        tk.Label(form, text="Top:", font=("Arial", 11), bg="#f5f5f5").grid(row=0, column=4, padx=5)
+        self.limit_var = tk.StringVar(value=str(TOP_N))
+        tk.Spinbox(form, textvariable=self.limit_var, from_=1, to=1000, increment=10, width=6).grid(row=0, column=5)
+        tk.Button(form, text="Reset Weights", font=("Arial", 11), relief="flat", command=self.reset_weights).grid(row=0, column=6, padx=10)
+        # The arrows and typing both write the variable, so its trace alone re-ranks
+        for var in (self.min_att_var, self.limit_var):
+            var.trace_add("write", lambda *args: self.refresh())
+
+        # One slider per metric; moving any of them re-ranks immediately
+        weights = tk.Frame(self.window, bg="#f5f5f5")
+        weights.pack(pady=(0, 5))
+        self.weight_vars = {}
+        for i, name in enumerate(scoring.METRICS):
+            var = tk.DoubleVar(value=scoring.DEFAULT_WEIGHTS.get(name, 0.0))
+            tk.Scale(weights, label=scoring.METRIC_LABELS.get(name, name), variable=var, from_=-2.0, to=3.0,
+                     resolution=0.25, orient="horizontal", length=130, bg="#f5f5f5", highlightthickness=0,
+                     command=lambda value: self.refresh()).grid(row=0, column=i, padx=4)
+            self.weight_vars[name] = var
+
+        self.info_var = tk.StringVar(value="")
+        tk.Label(self.window, textvariable=self.info_var, font=("Arial", 10), bg="#f5f5f5", fg="#6c757d").pack()
+
+        table_frame = tk.Frame(self.window, bg="#f5f5f5")
+        table_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.columns = ("Rank",) + scoring.RESULT_COLUMNS
+        self.table = VirtualTable(table_frame, self.columns, {"Player": 150, "Rank": 50, "Year": 60, "Score": 80}, height=20)
+
+        self.refresh()
+
+    def reset_weights(self):
+        for name, var in self.weight_vars.items():
+            var.set(self.scoring.DEFAULT_WEIGHTS.get(name, 0.0))
+        self.refresh()
+
+    def refresh(self, event=None):
+        try:
+            min_att = float(self.min_att_var.get() or 0)
+            limit = int(self.limit_var.get() or TOP_N)
+        except ValueError:
+            # Keep the last ranking while a number is being typed
+            return
+        scope = self.scope_var.get()
+        years = None if scope == self.ALL_SEASONS else [int(scope)]
+        weights = {name: var.get() for name, var in self.weight_vars.items()}
+
+        start = time.perf_counter()
+        rows = self.engine.rank(weights, min_att, limit, years)
+        elapsed = time.perf_counter() - start
+        self.table.set_model(TableModel(self.columns, [(rank,) + row for rank, row in enumerate(rows, 1)]))
+        seasons = len(self.engine.years()) if years is None else 1
+        self.info_var.set(f"{len(rows)} passers ({min_att:g}+ attempts after {MIN_ATTEMPTS_AFTER}) "
+                          f"from {seasons} cached season(s), "
+                          f"ranked in {elapsed * 1000:.1f} ms")
+
+
+class CareerWindow:
+    """Search players as you type and show every cached season of the one picked"""
+
+    columns = ("Year", "Team", "Att", "Yds", "TD", "INT", "Rate", "QBR",
+               "Yds Z-Score", "TD Z-Score", "Eff Z-Score", "Total Z-Score")
+
+    def __init__(self, root, cache_dir):
+        from nfldeepdive.careers import CareerIndex
+
+        self.careers = CareerIndex(cache_dir)
+        # Pick up any parsed seasons that were cached before the index existed
+        self.careers.index.sync(cache_dir)
+        self.matches = []
+
+        self.window = tk.Toplevel(root)
+        self.window.title("Player Careers")
+        self.window.geometry("1200x600")
+        self.window.configure(bg="#f5f5f5")
+
+        search = tk.Frame(self.window, bg="#f5f5f5")
+        search.pack(side="left", fill="y", padx=(20, 10), pady=20)
+        tk.Label(search, text="Player:", font=("Arial", 11), bg="#f5f5f5").pack(anchor="w")
+        self.query_var = tk.StringVar()
+        entry = tk.Entry(search, textvariable=self.query_var, width=30, font=("Arial", 11))
+        entry.pack(fill="x", pady=(0, 5))
+        entry.focus_set()
+        self.query_var.trace_add("write", lambda *args: self.search())
+        self.results = tk.Listbox(search, width=40, height=25, font=("Arial", 10), activestyle="none")
+        self.results.pack(fill="y", expand=True)
+        self.results.bind("<<ListboxSelect>>", self.show_career)
+
+        detail = tk.Frame(self.window, bg="#f5f5f5")
+        detail.pack(side="left", fill="both", expand=True, padx=(10, 20), pady=20)
+        self.title_var = tk.StringVar(value="Type a name to search every cached season.")
+        tk.Label(detail, textvariable=self.title_var, font=("Arial", 14, "bold"), bg="#f5f5f5", fg="#1d3557", anchor="w").pack(fill="x")
+        self.summary_var = tk.StringVar(value="")
+        tk.Label(detail, textvariable=self.summary_var, font=("Arial", 10), bg="#f5f5f5", fg="#6c757d", anchor="w").pack(fill="x", pady=(0, 5))
+        self.table = VirtualTable(detail, self.columns, {"Year": 60, "Team": 60}, height=20)
+
+    def search(self):
+        self.matches = self.careers.search(self.query_var.get())
+        self.results.delete(0, "end")
+        for match in self.matches:
+            self.results.insert("end", f"{match.name}  ({match.first_year}-{match.last_year}, {len(match)} season(s))")
+
+    def show_career(self, event=None):
+        selection = self.results.curselection()
+        if not selection:
+            return
+        match = self.matches[selection[0]]
+        rows = self.careers.career(match)
+        self.table.set_model(TableModel(self.columns, [
+            (year, team, att, yds, td, ints, rate, qbr, yds_z, td_z, eff_z, total_z)
+            for year, _, team, att, yds, td, ints, rate, qbr, yds_z, td_z, eff_z, total_z, _ in rows
+        ]))
+        self.title_var.set(match.name)
+        yards = sum(row[4] or 0 for row in rows)
+        touchdowns = sum(row[5] or 0 for row in rows)
+        best = max(rows, key=lambda row: row[12]) if rows else None
+        self.summary_var.set(
+            f"{len(rows)} cached season(s), {yards:,.0f} yards, {touchdowns:.0f} TD"
+            + (f"; best Total Z-Score {best[12]:.2f} in {best[0]}" if best else "")
+        )
+
+
+def main():
+    root = tk.Tk()
+    app = NFLPassingStatsApp(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Find players by name and follow their careers across every indexed season.
+
+The leaderboard index stores each player-season under the player's normalized
+name (``season.normalize_name``), so a career is a single indexed query.  On
+top of it ``CareerIndex`` keeps an in-memory inverted index of names for
+search as you type:
+
+* every name is filed under its full normalized form and under each word, in
+  one sorted list, so a prefix of the first name, last name or whole name is
+  a binary search (with several words, each has to start a word of the name);
+* when prefixes find too little, ``difflib`` suggests close spellings of
+  each query word among the words of about the same length, and the names
+  found are ranked by how much they look like the whole query;
+* ``refresh`` compares each season's last update time with what it saw last
+  and only re-reads seasons that were added, replaced or removed since, so
+  the index keeps up as seasons are fetched without being rebuilt.
+"""
+import bisect
+import difflib
+
+from nfldeepdive.leaderboard import LeaderboardIndex
+from nfldeepdive.season import display_name, normalize_name
+
+# Search results shown by default
+SEARCH_LIMIT = 20
+
+# How close a spelling has to be for a fuzzy match (difflib ratio)
+FUZZY_CUTOFF = 0.75
+
+
+class PlayerEntry:
+    """One player (by normalized name) and the seasons they appear in"""
+
+    __slots__ = ("key", "seasons")
+
+    def __init__(self, key):
+        self.key = key
+        self.seasons = {}  # year -> name as shown that season
+
+    @property
+    def name(self):
+        return self.seasons[max(self.seasons)]
+
+    @property
+    def first_year(self):
+        return min(self.seasons)
+
+    @property
+    def last_year(self):
+        return max(self.seasons)
+
+    def __len__(self):
+        return len(self.seasons)
+
+    def __repr__(self):
+        return f"PlayerEntry({self.name!r}, {self.first_year}-{self.last_year})"
+
+
+class CareerIndex:
+    """Name search over every indexed season, kept in step with the leaderboard index"""
+
+    def __init__(self, cache_dir):
+        self.index = LeaderboardIndex(cache_dir)
+        self.players = {}        # normalized name -> PlayerEntry
+        self._season_keys = {}   # year -> normalized names in that season
+        self._versions = {}      # year -> update time of the season when it was read
+        self._tokens = None      # sorted (word or full name, normalized name), rebuilt when players change
+        self._words = None       # word length -> distinct words, for fuzzy matching
+
+    def refresh(self):
+        """Read seasons added, replaced or removed since the last refresh; returns those years"""
+        versions = self.index.season_versions()
+        changed = sorted(year for year, updated in versions.items() if self._versions.get(year) != updated)
+        removed = sorted(year for year in self._versions if year not in versions)
+        for year in removed:
+            self._drop_season(year)
+        for year in changed:
+            self._drop_season(year)
+            self._add_season(year, self.index.season_players(year))
+        self._versions = versions
+        if changed or removed:
+            self._tokens = self._words = None
+        return changed + removed
+
+    def _add_season(self, year, rows):
+        keys = []
+        for key, name in rows:
+            entry = self.players.get(key)
+            if entry is None:
+                entry = self.players[key] = PlayerEntry(key)
+            entry.seasons[year] = display_name(name)
+            keys.append(key)
+        self._season_keys[year] = keys
+
+    def _drop_season(self, year):
+        for key in self._season_keys.pop(year, ()):
+            entry = self.players.get(key)
+            if entry is None:
+                continue
+            entry.seasons.pop(year, None)
+            if not entry.seasons:
+                del self.players[key]
+
+    def tokens(self):
+        if self._tokens is None:
+            pairs = set()
+            for key in self.players:
+                pairs.add((key, key))
+                for word in key.split():
+                    pairs.add((word, key))
+            self._tokens = sorted(pairs)
+        return self._tokens
+
+    def _keys_for(self, token, exact=False):
+        tokens = self.tokens()
+        i = bisect.bisect_left(tokens, (token,))
+        while i < len(tokens) and (tokens[i][0] == token if exact else tokens[i][0].startswith(token)):
+            yield tokens[i]
+            i += 1
+
+    def prefix_matches(self, query):
+        """{normalized name: whether the whole name starts with ``query``} for every prefix match"""
+        keys = {}
+        for token, key in self._keys_for(query):
+            # A match on the whole name ranks above a match on one word
+            keys[key] = keys.get(key, False) or token == key
+        words = query.split()
+        if len(words) > 1:
+            # "favre 7" or "brady tom": every word of the query starts some word of the name
+            for token, key in self._keys_for(max(words, key=len)):
+                if key not in keys and all(any(part.startswith(w) for part in key.split()) for w in words):
+                    keys[key] = False
+        return keys
+
+    def fuzzy_matches(self, query, limit):
+        """Names with a word spelled close to one of the query's, most like the whole query first"""
+        if self._words is None:
+            self._words = {}
+            for token, _ in self.tokens():
+                if " " not in token:
+                    self._words.setdefault(len(token), set()).add(token)
+        keys = set()
+        for word in set(query.split()):
+            candidates = [w for n in range(len(word) - 2, len(word) + 3) for w in self._words.get(n, ())]
+            for close in difflib.get_close_matches(word, candidates, n=limit, cutoff=FUZZY_CUTOFF):
+                keys.update(key for _, key in self._keys_for(close, exact=True))
+        # SequenceMatcher caches what it learns about its second sequence, so that one is the query
+        matcher = difflib.SequenceMatcher(None, "", query)
+        ratios = {}
+        for key in keys:
+            matcher.set_seq1(key)
+            ratios[key] = matcher.ratio()
+        return sorted(keys, key=lambda key: (-ratios[key], -len(self.players[key]), key))[:limit]
+
+    def search(self, query, limit=SEARCH_LIMIT, refresh=True):
+        """Players matching ``query`` by prefix, then by close spelling, as PlayerEntry objects"""
+        if refresh:
+            self.refresh()
+        query = normalize_name(query)
+        if not query:
+            return []
+        prefix = self.prefix_matches(query)
+        ranked = sorted(prefix, key=lambda key: (not prefix[key], -len(self.players[key]), key))[:limit]
+        if len(ranked) < limit:
+            ranked += [key for key in self.fuzzy_matches(query, limit) if key not in prefix][:limit - len(ranked)]
+        return [self.players[key] for key in ranked]
+
+    def career(self, player):
+        """Every indexed season of a player (a PlayerEntry or any spelling of the name), oldest first"""
+        key = player.key if isinstance(player, PlayerEntry) else normalize_name(player)
+        return self.index.career(key)
@@ -0,0 +1,307 @@
+"""Command-line interface: ``nfldeepdive season``, ``leaderboard``, ``career``, ``watch``,
+``export``, ``serve``, ``prefetch``, ``rebuild``, ``cache`` and ``gui``.
+
+Only what a command needs is imported: cached queries never load tkinter,
+requests or numpy, so they start quickly and run on machines without a
+display.
+"""
+import argparse
+import os
+import sys
+
+from nfldeepdive import DEFAULT_CACHE_DIR
+from nfldeepdive import export
+from nfldeepdive.leaderboard import RANKABLE
+from nfldeepdive.season import FIRST_SEASON, LAST_SEASON, TOP_N
+
+LEADERBOARD_INTEGER_COLUMNS = frozenset(("rank", "year", "att", "yds", "td", "int"))
+
+# Shortest gap between checks of the real site when watching a season
+MIN_WATCH_INTERVAL = 60
+
+
+def write_rows(args, columns, rows):
+    if args.format == "parquet":
+        export.write_parquet(columns, rows, args.output)
+        return
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            export.write_json(columns, rows, out)
+        else:
+            export.write_csv(columns, rows, out)
+    finally:
+        if args.output:
+            out.close()
+
+
+def run_season(args):
+    from contextlib import nullcontext
+
+    from nfldeepdive import instrument
+    from nfldeepdive.pipeline import season_table
+
+    def progress(message):
+        print(message, file=sys.stderr, flush=True)
+
+    trace = instrument.Trace(f"Season {args.year}")
+    trace.profile_path = args.profile
+    profiling = instrument.profiled(args.profile) if args.profile else nullcontext()
+    with instrument.activate(trace), profiling:
+        model = season_table(args.year, args.cache_dir, progress=progress, top_n=args.top)
+        with instrument.span("export"):
+            write_rows(args, model.columns, export.plain_rows(model.columns, model.rows))
+    if args.trace:
+        print(trace.report(), file=sys.stderr)
+        instrument.append_log(trace, os.path.join(args.cache_dir, instrument.TRACE_LOG))
+
+
+def run_leaderboard(args):
+    from nfldeepdive.leaderboard import RESULT_COLUMNS, LeaderboardIndex
+
+    index = LeaderboardIndex(args.cache_dir)
+    index.sync(args.cache_dir)
+    rows = index.top(args.top, start=args.start, end=args.end, team=args.team,
+                     min_attempts=args.min_att, order_by=args.by)
+    columns = ("rank",) + RESULT_COLUMNS
+    rows = [(rank,) + tuple(row) for rank, row in enumerate(rows, 1)]
+    write_rows(args, columns, export.plain_rows(columns, rows, LEADERBOARD_INTEGER_COLUMNS))
+
+
+def run_career(args):
+    from nfldeepdive.careers import CareerIndex
+    from nfldeepdive.leaderboard import RESULT_COLUMNS
+    from nfldeepdive.season import normalize_name
+
+    careers = CareerIndex(args.cache_dir)
+    careers.index.sync(args.cache_dir)
+    matches = careers.search(args.name, args.limit)
+    if not matches:
+        raise Exception(f"No player matching {args.name!r} in the cached seasons.")
+    exact = [m for m in matches if m.key == normalize_name(args.name)]
+    if args.list or (not exact and len(matches) > 1):
+        for match in matches:
+            print(f"{match.name:<28} {match.first_year}-{match.last_year}  {len(match)} season(s)")
+        return 0
+    rows = careers.career(exact[0] if exact else matches[0])
+    write_rows(args, RESULT_COLUMNS, export.plain_rows(RESULT_COLUMNS, rows, LEADERBOARD_INTEGER_COLUMNS))
+
+
+def run_watch(args):
+    import time
+
+    from nfldeepdive.fetch import BASE_URL, Fetcher
+    from nfldeepdive.pipeline import refresh_season
+
+    server = None
+    base_url = BASE_URL
+    if args.standin:
+        from nfldeepdive.standin import StandInServer
+        server = StandInServer(args.standin).start()
+        base_url = server.base_url
+        print(f"Serving {args.standin} at {base_url}", file=sys.stderr)
+    fetcher = Fetcher(base_url)
+
+    checks = 0
+    try:
+        while True:
+            started = time.perf_counter()
+            season, diff = refresh_season(args.year, args.cache_dir, fetcher=fetcher)
+            elapsed = time.perf_counter() - started
+            status = diff.summary() if diff is not None else "no change"
+            print(f"{time.strftime('%H:%M:%S')} {args.year}: {len(season)} passers, {status} "
+                  f"({elapsed * 1000:.0f} ms)", flush=True)
+            checks += 1
+            if args.checks and checks >= args.checks:
+                return 0
+            time.sleep(args.interval)
+    finally:
+        if server is not None:
+            server.stop()
+
+
+def run_export(args):
+    years = None
+    if args.start is not None or args.end is not None:
+        years = range(args.start or FIRST_SEASON, (args.end or LAST_SEASON) + 1)
+    written = export.write_dataset(args.cache_dir, args.output, args.format, years)
+    if not written:
+        raise Exception("No parsed seasons to export; fetch or prefetch some first.")
+    sidecar = f" (schema in {args.output}{export.SCHEMA_SUFFIX})" if args.format == "csv" else ""
+    print(f"Wrote {written} player-seasons to {args.output}{sidecar}", file=sys.stderr)
+
+
+def run_serve(args):
+    from nfldeepdive.service import QueryService, ServiceServer
+
+    service = QueryService.from_cache(args.cache_dir, args.response_cache)
+    server = ServiceServer(service, args.host, args.port)
+    print(f"Serving {len(service.dataset)} player-seasons from {len(service.dataset.by_year)} seasons "
+          f"at {server.base_url}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def run_rebuild(args):
+    from nfldeepdive.rebuild import rebuild
+
+    years = None
+    if args.start is not None or args.end is not None:
+        years = range(args.start or FIRST_SEASON, (args.end or LAST_SEASON) + 1)
+
+    def report(done, total, year, error):
+        print(f"[{done}/{total}] {year}: {error or 'ok'}", file=sys.stderr, flush=True)
+
+    summary = rebuild(args.cache_dir, years, args.workers, args.chunksize, on_progress=report)
+    print(
+        f"{len(summary['rebuilt'])} seasons rebuilt, {len(summary['failed'])} failed "
+        f"({summary['workers']} workers, chunks of {summary['chunksize']}): "
+        f"parse {summary['parse_seconds']:.2f}s, store and index {summary['merge_seconds']:.2f}s"
+    )
+    for year, error in sorted(summary["failed"].items()):
+        print(f"  {year}: {error}")
+    return 1 if summary["failed"] else 0
+
+
+def run_cache(args):
+    from nfldeepdive.htmlcache import PageCache
+
+    pages = PageCache(args.cache_dir)
+    if args.max_mb is not None:
+        evicted = pages.evict(max_bytes=int(args.max_mb * 1024 * 1024))
+        if evicted:
+            print(f"Evicted {', '.join(str(y) for y in evicted)}")
+    entries = sorted(pages.entries(), key=lambda e: e[2])
+    print(f"{len(entries)} pages, {pages.total_size() / 1024 / 1024:.1f} MB in {pages.directory}")
+    for _, _, year in entries:
+        meta = pages.meta(year)
+        state = "fresh" if pages.is_fresh(year, meta) else "stale"
+        print(f"  {year}  {meta.get('size', 0) / 1024:7.0f} KB  {state:<5}  etag {meta.get('etag') or '-'}")
+
+
+def run_gui(args):
+    from nfldeepdive.app import main as gui_main
+    gui_main()
+
+
+def add_output_arguments(parser):
+    parser.add_argument("--format", choices=export.FORMATS, default="csv",
+                        help="output format (default %(default)s)")
+    parser.add_argument("-o", "--output", metavar="FILE", help="write to FILE instead of standard output")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default %(default)s)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="nfldeepdive", description="NFL passing stats and z-scores by season.")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    season = commands.add_parser("season", help="top passers of one season with their z-scores")
+    season.add_argument("year", type=int, help=f"season ({FIRST_SEASON}-{LAST_SEASON})")
+    season.add_argument("--top", type=int, default=TOP_N, help="number of passers by yards (default %(default)s)")
+    season.add_argument("--trace", action="store_true",
+                        help="print stage timings and counters to standard error and append them to the trace log")
+    season.add_argument("--profile", metavar="FILE", help="write a cProfile capture of the load to FILE")
+    add_output_arguments(season)
+    season.set_defaults(run=run_season)
+
+    leaders = commands.add_parser("leaderboard", help="best player-seasons across every cached season")
+    leaders.add_argument("--top", type=int, default=25, help="number of player-seasons (default %(default)s)")
+    leaders.add_argument("--start", type=int, help="first season to include")
+    leaders.add_argument("--end", type=int, help="last season to include")
+    leaders.add_argument("--team", help="only this team, e.g. SFO")
+    leaders.add_argument("--min-att", type=float, help="minimum pass attempts")
+    leaders.add_argument("--by", default="total_z", choices=sorted(RANKABLE),
+                         help="ranking column (default %(default)s)")
+    add_output_arguments(leaders)
+    leaders.set_defaults(run=run_leaderboard)
+
+    career = commands.add_parser("career", help="every cached season of one player, found by name")
+    career.add_argument("name", help="player name or the start of it; close spellings are suggested")
+    career.add_argument("--list", action="store_true", help="only list the matching players")
+    career.add_argument("--limit", type=int, default=20, help="most players to list (default %(default)s)")
+    add_output_arguments(career)
+    career.set_defaults(run=run_career)
+
+    watch = commands.add_parser("watch", help="recheck a season in progress on a schedule, applying only changes")
+    watch.add_argument("year", type=int, help=f"season ({FIRST_SEASON}-{LAST_SEASON})")
+    watch.add_argument("--interval", type=float, default=900,
+                       help=f"seconds between checks (default %(default)s, at least {MIN_WATCH_INTERVAL} against the real site)")
+    watch.add_argument("--checks", type=int, help="stop after this many checks (default: run until interrupted)")
+    watch.add_argument("--standin", metavar="DIR",
+                       help="serve passing_<year>.html files from DIR on a local server instead of the real site")
+    watch.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default %(default)s)")
+    watch.set_defaults(run=run_watch)
+
+    dataset = commands.add_parser("export", help="every parsed player-season with z-scores as one typed table")
+    dataset.add_argument("-o", "--output", metavar="FILE", required=True, help="file to write")
+    dataset.add_argument("--format", choices=export.DATASET_FORMATS, default="parquet",
+                         help="parquet or arrow (need pyarrow), or csv with a .schema.json sidecar "
+                              "(default %(default)s)")
+    dataset.add_argument("--start", type=int, help="first season to include")
+    dataset.add_argument("--end", type=int, help="last season to include")
+    dataset.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default %(default)s)")
+    dataset.set_defaults(run=run_export)
+
+    serve = commands.add_parser("serve", help="read-only HTTP/JSON queries over every parsed season")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on (default %(default)s)")
+    serve.add_argument("--port", type=int, default=8765, help="port to listen on (default %(default)s)")
+    serve.add_argument("--response-cache", type=int, default=512,
+                       help="encoded responses kept in memory (default %(default)s)")
+    serve.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default %(default)s)")
+    serve.set_defaults(run=run_serve)
+
+    # Listed for --help only: main() hands prefetch arguments to the prefetcher's own parser
+    commands.add_parser("prefetch", help="download and cache every season (see prefetch --help)")
+
+    rebuild = commands.add_parser("rebuild", help="re-parse every cached page in parallel and rebuild the index")
+    rebuild.add_argument("--start", type=int, help="first season to rebuild (default: every cached page)")
+    rebuild.add_argument("--end", type=int, help="last season to rebuild")
+    rebuild.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    rebuild.add_argument("--chunksize", type=int, help="seasons handed to a worker at a time")
+    rebuild.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default %(default)s)")
+    rebuild.set_defaults(run=run_rebuild)
+
+    cache = commands.add_parser("cache", help="list cached pages and optionally trim the page cache")
+    cache.add_argument("--max-mb", type=float, help="evict least recently used pages until the cache fits")
+    cache.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default %(default)s)")
+    cache.set_defaults(run=run_cache)
+
+    gui = commands.add_parser("gui", help="open the desktop app")
+    gui.set_defaults(run=run_gui)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["prefetch"]:
+        from nfldeepdive.prefetch import main as prefetch_main
+        return prefetch_main(argv[1:], prog="nfldeepdive prefetch")
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "format", None) == "parquet" and not args.output:
+        parser.error("--format parquet needs --output FILE")
+    if args.command in ("season", "watch") and not FIRST_SEASON <= args.year <= LAST_SEASON:
+        parser.error(f"season must be between {FIRST_SEASON} and {LAST_SEASON}")
+    if args.command == "watch" and args.interval < MIN_WATCH_INTERVAL and not args.standin:
+        parser.error(f"--interval must be at least {MIN_WATCH_INTERVAL} seconds against the real site")
+    try:
+        return args.run(args) or 0
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # The reader went away (``| head``); send the rest of the output, and
+        # the flush at exit, to devnull rather than failing
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except Exception as e:
+        print(f"nfldeepdive: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
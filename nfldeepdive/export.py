@@ -0,0 +1,189 @@
+"""Write result tables as CSV, JSON or Parquet, and every parsed season as one dataset.
+
+Rows are the typed tuples used by TableModel.  Blank numbers (NaN or None)
+are written as empty CSV cells, JSON nulls and Parquet nulls, and counting
+stats are written as integers.
+
+``write_dataset`` exports every player-season in the parsed cache's z-score
+pools (the rows of the leaderboard index) with its z-scores as one table
+with a fixed, typed schema (``DATASET_SCHEMA``): Parquet or Arrow IPC
+through pyarrow, or CSV with the schema written next to it as
+``<file>.schema.json`` so readers do not have to guess the types.
+"""
+import csv
+import datetime
+import json
+
+from nfldeepdive.parser import PARSER_VERSION
+from nfldeepdive.season import INTEGER_COLUMNS, NUMERIC_COLUMNS, normalize_name
+
+FORMATS = ("csv", "json", "parquet")
+
+DATASET_FORMATS = ("parquet", "arrow", "csv")
+
+# (column, type, season column or z-score it comes from) for every player-season
+DATASET_SCHEMA = (
+    ("year", "int64", None),
+    ("player", "string", "Player"),
+    ("player_key", "string", None),
+    ("team", "string", "Team"),
+    ("g", "int64", "G"),
+    ("gs", "int64", "GS"),
+    ("cmp", "int64", "Cmp"),
+    ("att", "int64", "Att"),
+    ("cmp_pct", "float64", "Cmp%"),
+    ("yds", "int64", "Yds"),
+    ("td", "int64", "TD"),
+    ("int", "int64", "INT"),
+    ("y_a", "float64", "Y/A"),
+    ("y_g", "float64", "Y/G"),
+    ("rate", "float64", "Rate"),
+    ("qbr", "float64", "QBR"),
+    ("yds_z", "float64", None),
+    ("td_z", "float64", None),
+    ("eff_z", "float64", None),
+    ("total_z", "float64", None),
+    ("efficiency", "string", None),
+)
+DATASET_COLUMNS = tuple(name for name, _, _ in DATASET_SCHEMA)
+
+SCHEMA_SUFFIX = ".schema.json"
+
+
+def plain_value(value, integer=False):
+    if value is None or isinstance(value, str):
+        return value
+    if value != value:
+        return None
+    return int(value) if integer else float(value)
+
+
+def plain_rows(columns, rows, integer_columns=INTEGER_COLUMNS):
+    integer = [col in integer_columns for col in columns]
+    return [tuple(plain_value(v, i) for v, i in zip(row, integer)) for row in rows]
+
+
+def write_csv(columns, rows, out):
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow("" if v is None else v for v in row)
+
+
+def write_json(columns, rows, out):
+    json.dump([dict(zip(columns, row)) for row in rows], out, indent=1)
+    out.write("\n")
+
+
+def write_parquet(columns, rows, path):
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise Exception("Parquet output needs pyarrow (pip install pyarrow).")
+    data = {col: [row[i] for row in rows] for i, col in enumerate(columns)}
+    pyarrow.parquet.write_table(pyarrow.table(data), path)
+
+
+def season_dataset_rows(season, z):
+    """Dataset rows for the season's z-score pool; ``z`` is (yds_z, td_z, eff_z, total_z) aligned with its rows"""
+    cols = season.columns
+    efficiency = "QBR" if season.has_qbr else "Rate"
+    stats = [(cols[source], kind == "int64") for _, kind, source in DATASET_SCHEMA if source in NUMERIC_COLUMNS]
+    yds_z, td_z, eff_z, total_z = z
+    rows = []
+    for i, (player, qualifies) in enumerate(zip(cols["Player"], season.qualifying())):
+        if not qualifies:
+            continue
+        rows.append(
+            (season.year, player, normalize_name(player), cols["Team"][i])
+            + tuple(plain_value(column[i], integer) for column, integer in stats)
+            + (plain_value(yds_z[i]), plain_value(td_z[i]), plain_value(eff_z[i]), plain_value(total_z[i]), efficiency)
+        )
+    return rows
+
+
+def dataset_rows(cache_dir, years=None):
+    """Every player-season of the z-score pools in the parsed cache with its z-scores, season by season.
+
+    Z-scores come from the leaderboard index (brought up to date first) and
+    are only recomputed for a season the index cannot line up with.
+    """
+    from nfldeepdive.leaderboard import LeaderboardIndex
+    from nfldeepdive.store import SeasonStore
+
+    store = SeasonStore(cache_dir)
+    index = LeaderboardIndex(cache_dir)
+    index.sync(cache_dir)
+    wanted = None if years is None else set(years)
+    rows = []
+    for year in store.years():
+        if wanted is not None and year not in wanted:
+            continue
+        season = store.load(year)
+        if season is None or not len(season):
+            continue
+        z = index.season_scores(season)
+        if z is None:
+            from nfldeepdive.stats import score_season
+            scores = score_season(season)
+            z = (scores.z["Yds"], scores.z["TD"], scores.z["Eff"], scores.total)
+        rows.extend(season_dataset_rows(season, z))
+    return rows
+
+
+def dataset_schema(rows=None):
+    """The dataset's schema as written to the CSV sidecar"""
+    schema = {
+        "columns": [{"name": name, "type": kind, "nullable": source not in (None, "Player", "Team")}
+                    for name, kind, source in DATASET_SCHEMA],
+        "parser_version": PARSER_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+    if rows is not None:
+        schema["rows"] = len(rows)
+        schema["years"] = sorted({row[0] for row in rows})
+    return schema
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise Exception("Parquet and Arrow output need pyarrow (pip install pyarrow).")
+    return pyarrow
+
+
+def dataset_table(rows):
+    """The dataset as a pyarrow Table with the declared column types"""
+    pyarrow = _pyarrow()
+    types = {"int64": pyarrow.int64(), "float64": pyarrow.float64(), "string": pyarrow.string()}
+    schema = pyarrow.schema([(name, types[kind]) for name, kind, _ in DATASET_SCHEMA])
+    arrays = [pyarrow.array([row[i] for row in rows], type=field.type) for i, field in enumerate(schema)]
+    return pyarrow.Table.from_arrays(arrays, schema=schema)
+
+
+def write_dataset(cache_dir, path, fmt="parquet", years=None):
+    """Export every parsed player-season to ``path``; returns the number of rows written"""
+    if fmt not in DATASET_FORMATS:
+        raise ValueError(f"Unknown dataset format {fmt!r}")
+    if fmt != "csv":
+        # Fail before reading every season rather than after
+        _pyarrow()
+    rows = dataset_rows(cache_dir, years)
+    if fmt == "csv":
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            write_csv(DATASET_COLUMNS, rows, out)
+        with open(path + SCHEMA_SUFFIX, "w", encoding="utf-8") as out:
+            json.dump(dataset_schema(rows), out, indent=1)
+            out.write("\n")
+        return len(rows)
+
+    table = dataset_table(rows)
+    if fmt == "parquet":
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, path)
+    else:
+        import pyarrow.feather
+        pyarrow.feather.write_feather(table, path)
+    return len(rows)
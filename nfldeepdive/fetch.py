@@ -0,0 +1,332 @@
+"""Download season pages from Pro-Football-Reference into the page cache and parse them."""
+import math
+import threading
+import time
+from contextlib import nullcontext
+
+from nfldeepdive.instrument import count, span
+from nfldeepdive.parser import CHUNK_SIZE, PassingTableParser, iter_file_chunks
+from nfldeepdive.ratelimit import TokenBucket
+
+BASE_URL = "https://www.pro-football-reference.com"
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Referer": BASE_URL + "/",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Longest Retry-After worth waiting out before the next attempt; a longer one means we are being blocked
+MAX_RETRY_AFTER = 30
+
+
+class Cancelled(Exception):
+    """Raised inside a worker when its request has been cancelled or superseded"""
+
+
+def check_cancelled(cancel):
+    if cancel is not None and cancel.is_set():
+        raise Cancelled()
+
+
+def season_url(year, base_url=BASE_URL):
+    return f"{base_url}/years/{year}/passing.htm"
+
+
+def read_passing_table(chunks, sink=None, cancel=None):
+    """Stream page text through the table parser, optionally teeing it into ``sink`` (a PageWriter)"""
+    table = PassingTableParser()
+    rows = []
+    for chunk in chunks:
+        check_cancelled(cancel)
+        if sink is not None:
+            sink.write(chunk)
+        rows.extend(table.feed(chunk))
+        if table.done:
+            break
+    count("chars_read", table.chars_read)
+    count("table_rows", len(rows))
+    return table, rows
+
+
+class Fetcher:
+    """Downloads season pages through one pooled session.
+
+    The session is created and warmed up with a homepage visit only once, and
+    every request (warm-up and retries included) first takes a token from
+    ``limiter`` so bulk downloads stay under the site's rate limit.  Point
+    ``base_url`` at a local stand-in server to exercise the fetch path offline.
+    """
+
+    def __init__(self, base_url=BASE_URL, limiter=None, pool_size=4):
+        self.base_url = base_url.rstrip("/")
+        self.limiter = limiter if limiter is not None else TokenBucket()
+        self.pool_size = pool_size
+        self.session = None
+        self.warmed_up = False
+        self.requests_made = 0
+        self.lock = threading.Lock()
+        # Held through the warm-up request, so concurrent downloads wait for its cookies instead of repeating it
+        self.warm_up_lock = threading.Lock()
+
+    def url_for(self, year):
+        return season_url(year, self.base_url)
+
+    def get_session(self):
+        with self.lock:
+            if self.session is None:
+                # requests is only needed once something is actually downloaded
+                import requests
+                import requests.adapters
+
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(HEADERS)
+                self.session = session
+            return self.session
+
+    def request(self, url, cancel=None, **kwargs):
+        """GET through the shared session once the rate limiter allows it"""
+        if not self.limiter.acquire(cancel):
+            raise Cancelled()
+        with self.lock:
+            self.requests_made += 1
+        count("http_requests")
+        return self.get_session().get(url, **kwargs)
+
+    def warm_up(self, cancel=None):
+        # Visit the homepage once per session, like a browser would, to pick up cookies
+        if self.warmed_up:
+            return
+        with self.warm_up_lock:
+            if self.warmed_up:
+                return
+            self.warmed_up = True
+            with span("fetch.warm_up"):
+                try:
+                    self.request(self.base_url + "/", cancel, timeout=15)
+                except Cancelled:
+                    raise
+                except Exception:
+                    pass
+
+    def download_table(self, year, pages=None, cancel=None, progress=None, validators=None):
+        """Download a season page, parsing it as it arrives and saving it to the page cache.
+
+        With ``validators`` (If-None-Match / If-Modified-Since headers) the
+        request is conditional: a 304 marks the cached page as checked and
+        returns (None, None).  Only a page whose table arrived complete is
+        committed to ``pages``.
+        """
+        url = self.url_for(year)
+        headers = dict(HEADERS, **validators) if validators else HEADERS
+
+        # 1) Try the pooled session first
+        if progress:
+            progress("Connecting to Pro-Football-Reference")
+        self.warm_up(cancel)
+
+        last_err = None
+        for attempt in range(3):
+            check_cancelled(cancel)
+            if progress:
+                progress(f"Downloading {year} (attempt {attempt + 1} of 3)")
+            if attempt:
+                count("retries")
+            try:
+                with span("fetch.connect"):
+                    resp = self.request(url, cancel, headers=headers, timeout=20, stream=True)
+            except Cancelled:
+                raise
+            except Exception as ex:
+                count("request_errors")
+                last_err = ex
+                continue
+
+            if resp.status_code == 304:
+                resp.close()
+                count("not_modified")
+                if pages is not None:
+                    pages.mark_checked(year, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+                return None, None
+            if resp.status_code != 200:
+                resp.close()
+                count(f"http_{resp.status_code}")
+                last_err = Exception(f"HTTP {resp.status_code}")
+                if resp.status_code in (429, 503) and attempt < 2:
+                    self.back_off(resp.headers.get("Retry-After"), cancel)
+                continue
+
+            try:
+                return self.read_page(resp, url, pages, year, cancel)
+            except Cancelled:
+                raise
+            except Exception as ex:
+                # The connection dropped, or the page stopped before or inside the table: try again
+                count("truncated_pages")
+                last_err = ex
+
+        # 2) Fallback: try cloudscraper if available (handles Cloudflare)
+        if progress:
+            progress("Retrying through cloudscraper")
+        try:
+            import cloudscraper  # type: ignore
+        except ImportError:
+            raise Exception(
+                f"{last_err or 'HTTP 403'}. Try once more or install 'cloudscraper' (pip install cloudscraper) "
+                "and then click Fetch again."
+            )
+        with span("fetch.cloudscraper"):
+            scraper = cloudscraper.create_scraper(
+                browser={"browser": "chrome", "platform": "windows", "mobile": False}
+            )
+            if not self.limiter.acquire(cancel):
+                raise Cancelled()
+            with self.lock:
+                self.requests_made += 1
+            count("cloudscraper_requests")
+            resp2 = scraper.get(url, headers=HEADERS, timeout=25)
+            if resp2.status_code != 200:
+                raise Exception(f"HTTP {resp2.status_code}")
+            with self.page_writer(pages, year) as writer:
+                table, rows = read_passing_table([resp2.text], writer, cancel)
+                if writer is not None and table.done:
+                    writer.commit(url, resp2.headers.get("ETag"), resp2.headers.get("Last-Modified"))
+            return table, rows
+
+    def back_off(self, retry_after, cancel=None):
+        """Wait out a short Retry-After; a long one (or an HTTP date) ends the download instead"""
+        try:
+            delay = float(retry_after) if retry_after is not None else 0.0
+        except ValueError:
+            delay = math.inf
+        if delay > MAX_RETRY_AFTER:
+            raise Exception(f"Rate limited by Pro-Football-Reference (Retry-After: {retry_after}). Try again later.")
+        if delay <= 0:
+            return
+        count("backoff_ms", round(delay * 1000))
+        with span("fetch.backoff"):
+            if cancel is not None:
+                if cancel.wait(delay):
+                    raise Cancelled()
+            else:
+                time.sleep(delay)
+
+    def read_page(self, resp, url, pages, year, cancel=None):
+        """Parse a 200 response while it downloads, stopping once the table is complete"""
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        with resp, span("fetch.download"), self.page_writer(pages, year) as writer:
+            table, rows = read_passing_table(
+                resp.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True), writer, cancel
+            )
+            # A 200 without the table is a body cut off before it, not a season without one
+            if not table.found:
+                raise Exception(f"The {year} page ended before the passing table started.")
+            if not table.done:
+                raise Exception(f"The {year} page ended before the passing table did.")
+            if writer is not None:
+                writer.commit(url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+        return table, rows
+
+    @staticmethod
+    def page_writer(pages, year):
+        return pages.writer(year) if pages is not None else nullcontext()
+
+
+_default_fetcher = None
+_default_lock = threading.Lock()
+
+
+def default_fetcher():
+    """The process-wide Fetcher used when callers do not supply their own"""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = Fetcher()
+        return _default_fetcher
+
+
+def read_cached_table(pages, year, cancel=None):
+    """Parse a season from the page cache, or return (None, None) if it is missing or unreadable"""
+    if not pages.has(year):
+        count("html_cache_miss")
+        return None, None
+    try:
+        with span("cache.read"), pages.open_text(year) as f:
+            table, rows = read_passing_table(iter_file_chunks(f), cancel=cancel)
+    except Cancelled:
+        raise
+    except Exception:
+        count("html_cache_miss")
+        return None, None
+    count("html_cache_hit")
+    return table, rows
+
+
+def fetch_passing_table(year, pages, cancel=None, progress=None, fetcher=None):
+    """Return the parsed passing table for a season from the page cache or the website.
+
+    A cached page that is still fresh is used as is.  A stale one is
+    revalidated with a conditional GET and reused on a 304, or when the site
+    cannot be reached.
+    """
+    meta = pages.meta(year)
+    if meta is not None and pages.is_fresh(year, meta):
+        # Use cached HTML if available (avoids repeated requests and 403s)
+        if progress:
+            progress("Reading cached page")
+        table, rows = read_cached_table(pages, year, cancel)
+        if table is not None:
+            return table, rows
+        meta = None
+
+    if fetcher is None:
+        fetcher = default_fetcher()
+    if meta is None:
+        return fetcher.download_table(year, pages, cancel, progress)
+
+    if progress:
+        progress("Checking for an updated page")
+    try:
+        table, rows = fetcher.download_table(year, pages, cancel, progress, pages.validators(meta))
+    except Cancelled:
+        raise
+    except Exception:
+        count("revalidate_failed")
+        table = rows = None
+    if table is not None:
+        return table, rows
+    table, rows = read_cached_table(pages, year, cancel)
+    if table is not None:
+        return table, rows
+    return fetcher.download_table(year, pages, cancel, progress)
+
+
+def revalidate_page(year, pages, cancel=None, progress=None, fetcher=None):
+    """Ask the site whether a stale page whose season is already parsed has changed.
+
+    Returns the new (table, rows) if it has, or (None, None) if it has not or
+    the site could not be reached, in which case the parsed season stands.
+    """
+    if progress:
+        progress("Checking for an updated page")
+    if fetcher is None:
+        fetcher = default_fetcher()
+    try:
+        return fetcher.download_table(year, pages, cancel, progress, pages.validators(pages.meta(year)))
+    except Cancelled:
+        raise
+    except Exception:
+        count("revalidate_failed")
+        return None, None
@@ -0,0 +1,261 @@
+"""Compressed cache of downloaded season pages.
+
+Pages are stored gzip-compressed as ``cache/pages/passing_<year>.html.gz``
+next to a small JSON sidecar holding the URL, ETag and Last-Modified
+validators, when the page was fetched and last confirmed current, and the
+parser version at the time.  Both files are written to a temporary file and
+renamed into place, so an interrupted download never leaves a half page.
+
+A cached page is deliberately not the whole page: the download stops as soon
+as the passing table closes, so the file holds everything up to the chunk
+that contained ``</table>`` and none of the page chrome after it.  That is
+all the parser ever reads; a page is only committed once its table is
+complete.
+
+Finished seasons never change and are used as they are.  A season that is
+still in progress (or a page fetched before its season ended) is only trusted
+for ``ttl`` seconds; after that it is revalidated with a conditional GET,
+which costs a 304 instead of the whole page when nothing changed.
+
+The cache is kept under ``max_bytes`` by evicting the least recently used
+pages; reading a page touches its sidecar, whose mtime is the LRU clock.
+Uncompressed ``cache/passing_<year>.html`` files from older versions are
+moved into the cache the first time they are looked up.
+"""
+import glob
+import gzip
+import json
+import os
+import tempfile
+import time
+
+from nfldeepdive.parser import PARSER_VERSION
+
+PAGES_DIR = "pages"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# How long a page of a season that is still in progress is trusted without asking the site
+RECENT_TTL = 6 * 60 * 60
+
+# Playoffs are over by March, after which a season's page no longer changes
+FINAL_MONTH = 3
+
+
+def season_final_time(year):
+    """Timestamp after which the season's page is treated as final"""
+    return time.mktime((int(year) + 1, FINAL_MONTH, 1, 0, 0, 0, 0, 0, -1))
+
+
+def legacy_path(cache_dir, year):
+    """Where versions before the page cache stored uncompressed pages"""
+    return os.path.join(cache_dir, f"passing_{year}.html")
+
+
+def write_atomic(directory, path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class PageWriter:
+    """Streams a page into a compressed temporary file; nothing is cached until ``commit``.
+
+    Only what was downloaded is written, which ends shortly after the passing
+    table (see the module docstring).
+    """
+
+    def __init__(self, cache, year):
+        self.cache = cache
+        self.year = int(year)
+        os.makedirs(cache.directory, exist_ok=True)
+        fd, self.tmp_path = tempfile.mkstemp(dir=cache.directory, suffix=".part")
+        os.close(fd)
+        self.file = gzip.open(self.tmp_path, "wt", encoding="utf-8", compresslevel=6)
+        self.committed = False
+
+    def write(self, text):
+        self.file.write(text)
+
+    def commit(self, url=None, etag=None, last_modified=None):
+        self.file.close()
+        os.replace(self.tmp_path, self.cache.page_path(self.year))
+        now = self.cache.clock()
+        self.cache.write_meta(self.year, {
+            "year": self.year,
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched": now,
+            "checked": now,
+            "parser_version": PARSER_VERSION,
+            "size": os.path.getsize(self.cache.page_path(self.year)),
+        })
+        self.committed = True
+        self.cache.evict(keep=self.year)
+
+    def discard(self):
+        if not self.file.closed:
+            self.file.close()
+        if os.path.exists(self.tmp_path):
+            try:
+                os.remove(self.tmp_path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if not self.committed:
+            self.discard()
+
+
+class PageCache:
+    """Compressed season pages with revalidation metadata and a size cap"""
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES, ttl=RECENT_TTL, clock=time.time):
+        self.cache_dir = cache_dir
+        self.directory = os.path.join(cache_dir, PAGES_DIR)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+
+    def page_path(self, year):
+        return os.path.join(self.directory, f"passing_{int(year)}.html.gz")
+
+    def meta_path(self, year):
+        return os.path.join(self.directory, f"passing_{int(year)}.json")
+
+    def has(self, year):
+        self.migrate_legacy(year)
+        return os.path.exists(self.page_path(year))
+
+    def meta(self, year):
+        """Sidecar metadata for a cached page, or None if the page is not cached"""
+        if not self.has(year):
+            return None
+        try:
+            with open(self.meta_path(year), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Page without a sidecar (e.g. interrupted between the two renames): no validators
+            fetched = os.path.getmtime(self.page_path(year))
+            return {"year": int(year), "fetched": fetched, "checked": fetched}
+
+    def write_meta(self, year, meta):
+        os.makedirs(self.directory, exist_ok=True)
+        write_atomic(self.directory, self.meta_path(year), json.dumps(meta, indent=1).encode("utf-8"))
+
+    def is_fresh(self, year, meta=None):
+        """Whether the cached copy of a season can be used without asking the site.
+
+        Without metadata (no page cached) a finished season still counts as
+        fresh, since whatever was parsed from it cannot have changed.
+        """
+        final = season_final_time(year)
+        if meta is None:
+            meta = self.meta(year)
+        if meta is None:
+            return self.clock() >= final
+        checked = meta.get("checked", 0)
+        if checked >= final:
+            return True
+        return self.clock() - checked < self.ttl
+
+    def validators(self, meta):
+        """Conditional request headers for a cached page"""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def mark_checked(self, year, etag=None, last_modified=None):
+        """Record that the site confirmed the cached page is current (a 304)"""
+        meta = self.meta(year)
+        if meta is None:
+            return
+        meta["checked"] = self.clock()
+        if etag:
+            meta["etag"] = etag
+        if last_modified:
+            meta["last_modified"] = last_modified
+        self.write_meta(year, meta)
+
+    def open_text(self, year):
+        """Open the cached page for reading as text and mark it as recently used"""
+        f = gzip.open(self.page_path(year), "rt", encoding="utf-8")
+        try:
+            os.utime(self.meta_path(year))
+        except OSError:
+            pass
+        return f
+
+    def writer(self, year):
+        return PageWriter(self, year)
+
+    def remove(self, year):
+        for path in (self.page_path(year), self.meta_path(year)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def migrate_legacy(self, year):
+        legacy = legacy_path(self.cache_dir, year)
+        if os.path.exists(self.page_path(year)) or not os.path.exists(legacy):
+            return
+        fetched = os.path.getmtime(legacy)
+        with open(legacy, "r", encoding="utf-8") as f, self.writer(year) as writer:
+            for chunk in iter(lambda: f.read(256 * 1024), ""):
+                writer.write(chunk)
+            writer.commit()
+        meta = self.meta(year)
+        meta["fetched"] = meta["checked"] = fetched
+        self.write_meta(year, meta)
+        os.remove(legacy)
+
+    def entries(self):
+        """(last used, size, year) for every cached page"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, "passing_*.html.gz")):
+            name = os.path.basename(path)[len("passing_"):-len(".html.gz")]
+            if not name.isdigit():
+                continue
+            year = int(name)
+            try:
+                size = os.path.getsize(path)
+                used = os.path.getmtime(self.meta_path(year)) if os.path.exists(self.meta_path(year)) \
+                    else os.path.getmtime(path)
+            except OSError:
+                continue
+            entries.append((used, size, year))
+        return entries
+
+    def total_size(self):
+        """Bytes taken by every cached page"""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None, max_bytes=None):
+        """Remove least recently used pages until the cache fits; returns the evicted years"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        if limit is None:
+            return []
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for _, size, year in entries:
+            if total <= limit:
+                break
+            if year == keep:
+                continue
+            self.remove(year)
+            total -= size
+            evicted.append(year)
+        return evicted
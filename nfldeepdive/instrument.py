@@ -0,0 +1,157 @@
+"""Lightweight timing spans and counters for one season load.
+
+A ``Trace`` collects named spans (wall time, nesting depth) and counters for
+one request.  The worker activates it for its thread with ``activate``; code
+anywhere in the pipeline then records into it through the module-level
+``span`` and ``count``, which do nothing when no trace is active, so the
+pipeline's signatures stay as they are and untraced callers pay only a
+thread-local lookup.
+
+Finished traces can be appended to a JSON-lines log, and ``profiled`` wraps
+a block in cProfile for a one-off capture.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+TRACE_LOG = "trace.jsonl"
+
+_local = threading.local()
+
+
+class Trace:
+    """Spans and counters recorded while serving one request"""
+
+    def __init__(self, name):
+        self.name = name
+        self.created = time.time()
+        self.spans = []
+        self.counters = {}
+        self.profile_path = None
+        self._t0 = time.perf_counter()
+        self._depth = 0
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.spans.append({
+                "name": name,
+                "start": start - self._t0,
+                "duration": time.perf_counter() - start,
+                "depth": depth,
+            })
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def elapsed(self):
+        return time.perf_counter() - self._t0
+
+    def durations(self):
+        """Total seconds per span name (a span that ran twice is summed)"""
+        totals = {}
+        for s in self.spans:
+            totals[s["name"]] = totals.get(s["name"], 0.0) + s["duration"]
+        return totals
+
+    def summary(self, limit=4):
+        """One line for the status bar: total time and the slowest top-level stages"""
+        top_level = {}
+        for s in self.spans:
+            if s["depth"] == 0:
+                top_level[s["name"]] = top_level.get(s["name"], 0.0) + s["duration"]
+        slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:limit]
+        stages = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in slowest)
+        return f"{self.name}: {self.elapsed() * 1000:.0f} ms" + (f" ({stages})" if stages else "")
+
+    def report(self):
+        """Indented span tree and counters as text, for the debug panel"""
+        lines = [f"{self.name}  total {self.elapsed() * 1000:.1f} ms", ""]
+        for s in sorted(self.spans, key=lambda s: s["start"]):
+            label = "  " * s["depth"] + s["name"]
+            lines.append(f"{label:<32} {s['start'] * 1000:>9.1f} ms  {s['duration'] * 1000:>9.1f} ms")
+        if self.counters:
+            lines.append("")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<32} {value}")
+        if self.profile_path:
+            lines += ["", f"cProfile output: {self.profile_path}"]
+        return "\n".join(lines)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "created": self.created,
+            "total": self.elapsed(),
+            "spans": self.spans,
+            "counters": self.counters,
+            "profile": self.profile_path,
+        }
+
+
+def current():
+    """The trace active on this thread, or None"""
+    return getattr(_local, "trace", None)
+
+
+@contextmanager
+def activate(trace):
+    """Make ``trace`` the current trace for this thread for the duration of the block"""
+    previous = current()
+    _local.trace = trace
+    try:
+        yield trace
+    finally:
+        _local.trace = previous
+
+
+def span(name):
+    trace = current()
+    return trace.span(name) if trace is not None else nullcontext()
+
+
+def count(name, n=1):
+    trace = current()
+    if trace is not None:
+        trace.count(name, n)
+
+
+def append_log(trace, path):
+    """Append the trace as one JSON line; logging must never break a fetch"""
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(trace.as_dict()) + "\n")
+    except OSError:
+        pass
+
+
+@contextmanager
+def profiled(path):
+    """Run the block under cProfile (this thread only) and dump the stats to ``path``"""
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        profile.dump_stats(path)
+
+
+def profile_summary(path, limit=25):
+    """The ``limit`` most expensive functions by cumulative time, as text"""
+    out = io.StringIO()
+    pstats.Stats(path, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
@@ -0,0 +1,334 @@
+"""All-time, cross-era index of player-season z-scores.
+
+Every scored season is written to ``cache/leaderboard.sqlite`` (one row per
+player-season in the z-score pool, with its raw stats and per-metric and
+total z-scores).  Adding
+or refreshing a season only replaces that season's rows, and ranking queries
+are answered from indexed columns without touching HTML or parsed seasons.
+Rows also carry the player's normalized name, so a whole career is one
+indexed lookup.  Each season's running count, mean and sum of squared
+deviations per z-score metric are kept too, so a refreshed in-progress season
+can be applied row by row (see ``live``).
+"""
+import math
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from nfldeepdive.parser import PARSER_VERSION
+from nfldeepdive.season import normalize_name
+from nfldeepdive.store import SeasonStore
+
+INDEX_FILE = "leaderboard.sqlite"
+
+# Columns returned by LeaderboardIndex.top and career, in order
+RESULT_COLUMNS = (
+    "year", "player", "team", "att", "yds", "td", "int", "rate", "qbr",
+    "yds_z", "td_z", "eff_z", "total_z", "efficiency",
+)
+
+RANKABLE = frozenset(("total_z", "yds_z", "td_z", "eff_z", "yds", "td", "rate", "qbr", "att"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    year INTEGER PRIMARY KEY,
+    parser_version INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS player_seasons (
+    year INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    team TEXT NOT NULL,
+    att REAL, yds REAL, td REAL, int REAL, rate REAL, qbr REAL,
+    yds_z REAL NOT NULL, td_z REAL NOT NULL, eff_z REAL NOT NULL, total_z REAL NOT NULL,
+    efficiency TEXT NOT NULL,
+    player_key TEXT
+);
+CREATE INDEX IF NOT EXISTS player_seasons_total ON player_seasons (total_z DESC);
+CREATE INDEX IF NOT EXISTS player_seasons_year ON player_seasons (year);
+CREATE INDEX IF NOT EXISTS player_seasons_team ON player_seasons (team, total_z DESC);
+CREATE TABLE IF NOT EXISTS season_moments (
+    year INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    PRIMARY KEY (year, metric)
+);
+"""
+
+# z-score metrics and the player_seasons column each is computed from ("eff" is rate or qbr)
+_METRIC_COLUMNS = (("Yds", "yds_z", "yds"), ("TD", "td_z", "td"), ("Eff", "eff_z", None))
+
+_INSERT = (
+    "INSERT INTO player_seasons (year, player, team, att, yds, td, int, rate, qbr, "
+    "yds_z, td_z, eff_z, total_z, efficiency, player_key) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _nullable(value):
+    # SQLite has no NaN; store missing stats as NULL
+    value = float(value)
+    return None if value != value else value
+
+
+def _season_row(season, i, yds_z, td_z, eff_z, total_z, efficiency):
+    cols = season.columns
+    return (
+        season.year, cols["Player"][i], cols["Team"][i],
+        _nullable(cols["Att"][i]), _nullable(cols["Yds"][i]), _nullable(cols["TD"][i]),
+        _nullable(cols["INT"][i]), _nullable(cols["Rate"][i]), _nullable(cols["QBR"][i]),
+        float(yds_z), float(td_z), float(eff_z), float(total_z), efficiency, normalize_name(cols["Player"][i]),
+    )
+
+
+def _season_rows(season, scores):
+    """Rows of the season's passers in the z-score pool"""
+    return [
+        _season_row(season, i, scores.z["Yds"][i], scores.z["TD"][i], scores.z["Eff"][i], scores.total[i],
+                    scores.efficiency)
+        for i in range(len(season)) if scores.pool[i]
+    ]
+
+
+def _season_moments(scores):
+    """(metric, n, mean, m2) rows for the running moments of a freshly scored season"""
+    rows = []
+    for metric, _, _ in _METRIC_COLUMNS:
+        values = scores.values[metric]
+        finite = values[values == values]
+        mean = float(finite.mean()) if len(finite) else 0.0
+        rows.append((metric, len(finite), mean, float(((finite - mean) ** 2).sum())))
+    return rows
+
+
+class LeaderboardIndex:
+    """Persisted player-season z-score index backed by SQLite"""
+
+    def __init__(self, cache_dir):
+        self.path = os.path.join(cache_dir, INDEX_FILE)
+        os.makedirs(cache_dir, exist_ok=True)
+        with self.connect() as conn:
+            conn.executescript(_SCHEMA)
+            self._migrate(conn)
+
+    @staticmethod
+    def _migrate(conn):
+        """Add the normalized-name column to indexes written before careers were indexed"""
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(player_seasons)")]
+        if "player_key" not in columns:
+            conn.execute("ALTER TABLE player_seasons ADD COLUMN player_key TEXT")
+            rows = conn.execute("SELECT rowid, player FROM player_seasons").fetchall()
+            conn.executemany("UPDATE player_seasons SET player_key = ? WHERE rowid = ?",
+                             [(normalize_name(player), rowid) for rowid, player in rows])
+        conn.execute("CREATE INDEX IF NOT EXISTS player_seasons_player ON player_seasons (player_key, year)")
+
+    @contextmanager
+    def connect(self):
+        """Open a connection for one transaction (committed on success) and close it afterwards"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def indexed_years(self):
+        """{year: parser version} for every season in the index"""
+        with self.connect() as conn:
+            return dict(conn.execute("SELECT year, parser_version FROM seasons").fetchall())
+
+    def update_season(self, season, scores=None):
+        """Replace one season's rows; nothing else in the index is touched"""
+        self.update_seasons([season], None if scores is None else [scores])
+
+    def update_seasons(self, seasons, scores=None):
+        """Replace the rows of several seasons in one transaction (z-scores computed in one batch if not given)"""
+        seasons = list(seasons)
+        if scores is None:
+            from nfldeepdive.stats import score_seasons
+            scores = score_seasons(seasons)
+        with self.connect() as conn:
+            for season, season_scores in zip(seasons, scores):
+                conn.execute("DELETE FROM player_seasons WHERE year = ?", (season.year,))
+                rows = _season_rows(season, season_scores)
+                conn.executemany(_INSERT, rows)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO season_moments VALUES (?, ?, ?, ?, ?)",
+                    [(season.year,) + row for row in _season_moments(season_scores)],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?)",
+                    (season.year, PARSER_VERSION, len(rows), time.time()),
+                )
+
+    def season_moments(self, year):
+        """{metric: (n, mean, m2)} running moments of a season, or None if they are not stored"""
+        with self.connect() as conn:
+            rows = conn.execute("SELECT metric, n, mean, m2 FROM season_moments WHERE year = ?", (int(year),)).fetchall()
+        moments = {metric: (n, mean, m2) for metric, n, mean, m2 in rows}
+        return moments if len(moments) == len(_METRIC_COLUMNS) else None
+
+    def apply_season_changes(self, season, removed, updated, added, moments):
+        """Apply a diff of a season in one transaction.
+
+        ``removed`` are player names; ``updated`` and ``added`` are row indices
+        into ``season`` (passers who left or joined the z-score pool count as
+        removed or added); ``moments`` maps each metric to ((n, mean, m2), std)
+        after the change.  Only those rows are written, then the season's
+        z-scores are rescaled from the new means and standard deviations.
+        """
+        year = season.year
+        efficiency = "QBR" if season.has_qbr else "Rate"
+        cols = season.columns
+        with self.connect() as conn:
+            conn.executemany("DELETE FROM player_seasons WHERE year = ? AND player = ?",
+                             [(year, player) for player in removed])
+            conn.executemany(
+                "UPDATE player_seasons SET team = ?, att = ?, yds = ?, td = ?, int = ?, rate = ?, qbr = ? "
+                "WHERE year = ? AND player = ?",
+                [
+                    (cols["Team"][i], _nullable(cols["Att"][i]), _nullable(cols["Yds"][i]),
+                     _nullable(cols["TD"][i]), _nullable(cols["INT"][i]), _nullable(cols["Rate"][i]),
+                     _nullable(cols["QBR"][i]), year, cols["Player"][i])
+                    for i in updated
+                ],
+            )
+            conn.executemany(_INSERT, [
+                _season_row(season, i, 0.0, 0.0, 0.0, 0.0, efficiency)
+                for i in added
+            ])
+
+            # SQLite yields NULL for x / NULL and x / 0, so a missing value or an unusable
+            # standard deviation gives a z-score of 0, as in the batch engine
+            params = {}
+            terms = []
+            for metric, z_column, value_column in _METRIC_COLUMNS:
+                (n, mean, m2), std = moments[metric]
+                params[metric + "_mean"] = mean
+                params[metric + "_std"] = std if std == std and std > 0 else None
+                terms.append(f"COALESCE(({value_column or efficiency.lower()} - :{metric}_mean) / :{metric}_std, 0.0)")
+            conn.execute(
+                f"UPDATE player_seasons SET yds_z = {terms[0]}, td_z = {terms[1]}, eff_z = {terms[2]}, "
+                f"total_z = {terms[0]} + {terms[1]} + {terms[2]} WHERE year = :year",
+                dict(params, year=year),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO season_moments VALUES (?, ?, ?, ?, ?)",
+                [(year, metric) + moments[metric][0] for metric, _, _ in _METRIC_COLUMNS],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?)",
+                (year, PARSER_VERSION, sum(season.qualifying()), time.time()),
+            )
+
+    def season_scores(self, season):
+        """Stored (yds_z, td_z, eff_z, total_z) columns aligned with ``season``'s rows.
+
+        Rows are matched by player name, since a season updated in place keeps
+        its rows in the order they were first indexed; passers outside the
+        z-score pool are not indexed and get NaN.  Returns None when the season
+        is missing, was indexed by another parser version or does not hold
+        exactly the season's pool.
+        """
+        with self.connect() as conn:
+            version = conn.execute("SELECT parser_version FROM seasons WHERE year = ?", (season.year,)).fetchone()
+            if version is None or version[0] != PARSER_VERSION:
+                return None
+            rows = conn.execute(
+                "SELECT player, yds_z, td_z, eff_z, total_z FROM player_seasons WHERE year = ?",
+                (season.year,),
+            ).fetchall()
+        pool = season.qualifying()
+        if len(rows) != sum(pool):
+            return None
+        by_player = {row[0]: row[1:] for row in rows}
+        missing = (math.nan,) * 4
+        try:
+            aligned = [by_player[player] if qualifies else missing
+                       for player, qualifies in zip(season.columns["Player"], pool)]
+        except KeyError:
+            return None
+        return tuple(zip(*aligned)) if aligned else ((), (), (), ())
+
+    def season_versions(self):
+        """{year: last updated time} for every indexed season, to spot seasons changed since a refresh"""
+        with self.connect() as conn:
+            return dict(conn.execute("SELECT year, updated FROM seasons").fetchall())
+
+    def season_players(self, year):
+        """(normalized name, name as shown) for every player of one indexed season"""
+        with self.connect() as conn:
+            return conn.execute(
+                "SELECT player_key, player FROM player_seasons WHERE year = ? ORDER BY rowid", (int(year),)
+            ).fetchall()
+
+    def career(self, player_key):
+        """Every indexed season of one player (by normalized name), oldest first"""
+        with self.connect() as conn:
+            return conn.execute(
+                f"SELECT {', '.join(RESULT_COLUMNS)} FROM player_seasons WHERE player_key = ? ORDER BY year",
+                (player_key,),
+            ).fetchall()
+
+    def remove_season(self, year):
+        """Drop one season and its moments from the index"""
+        with self.connect() as conn:
+            conn.execute("DELETE FROM player_seasons WHERE year = ?", (int(year),))
+            conn.execute("DELETE FROM season_moments WHERE year = ?", (int(year),))
+            conn.execute("DELETE FROM seasons WHERE year = ?", (int(year),))
+
+    def sync(self, cache_dir):
+        """Index every parsed season that is missing or was indexed by an older parser.
+
+        Seasons with no parsed file for the current parser (deleted, or parsed
+        by an older one and not yet reparsed) are dropped from the index.
+        Returns the list of years that were (re)indexed.
+        """
+        store = SeasonStore(cache_dir)
+        indexed = self.indexed_years()
+        stored = store.years()
+        for year in set(indexed).difference(stored):
+            self.remove_season(year)
+        seasons = []
+        for year in stored:
+            if indexed.get(year) == PARSER_VERSION:
+                continue
+            season = store.load(year)
+            if season is not None and len(season):
+                seasons.append(season)
+        if seasons:
+            self.update_seasons(seasons)
+        return [season.year for season in seasons]
+
+    def top(self, n=25, start=None, end=None, team=None, min_attempts=None, order_by="total_z"):
+        """Top ``n`` player-seasons ever by ``order_by``, optionally filtered by era, team and attempts"""
+        if order_by not in RANKABLE:
+            raise ValueError(f"Cannot rank by {order_by!r}")
+        clauses = []
+        params = []
+        if start is not None:
+            clauses.append("year >= ?")
+            params.append(int(start))
+        if end is not None:
+            clauses.append("year <= ?")
+            params.append(int(end))
+        if team:
+            clauses.append("team = ?")
+            params.append(team.upper())
+        if min_attempts:
+            clauses.append("att >= ?")
+            params.append(float(min_attempts))
+        where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+        # z-score columns are never NULL, so only raw stats need nulls pushed to the end
+        nulls_last = "" if order_by.endswith("_z") else f"{order_by} IS NULL, "
+        sql = (
+            f"SELECT {', '.join(RESULT_COLUMNS)} FROM player_seasons {where} "
+            f"ORDER BY {nulls_last}{order_by} DESC, year LIMIT ?"
+        )
+        params.append(int(n))
+        with self.connect() as conn:
+            return conn.execute(sql, params).fetchall()
@@ -0,0 +1,163 @@
+"""Incremental updates of a season that is still being played.
+
+When a refreshed page of an in-progress season comes in, most passers' rows
+are unchanged.  Instead of re-scoring and re-indexing the whole season,
+``update_index`` diffs the new season against the stored one and:
+
+* adjusts the season's running count, mean and sum of squared deviations
+  for each z-score metric (Welford's method, which also supports removing a
+  value) for just the added, removed and changed rows;
+* rewrites only those rows in the leaderboard index;
+* rescales the season's z-scores from the new mean and standard deviation in
+  one SQL statement.  A new mean moves every z-score of the season, but the
+  work is a single pass over that season's rows in SQLite, with nothing
+  recomputed from the raw values.
+
+The running moments are stored in the index next to the rows, so they carry
+over from one refresh to the next.
+"""
+import math
+
+from nfldeepdive.parser import PARSER_VERSION
+from nfldeepdive.season import NUMERIC_COLUMNS
+from nfldeepdive.stats import DDOF, METRICS, efficiency_column
+
+
+class RunningStats:
+    """Count, mean and sum of squared deviations of a stream of values (NaN is skipped)"""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, x):
+        if x != x:
+            return
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x):
+        if x != x or self.n == 0:
+            return
+        if self.n == 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        mean = (self.n * self.mean - x) / (self.n - 1)
+        # Rounding can leave a hair below zero when the last spread-out values go
+        self.m2 = max(self.m2 - (x - self.mean) * (x - mean), 0.0)
+        self.mean = mean
+        self.n -= 1
+
+    def replace(self, old, new):
+        self.remove(old)
+        self.add(new)
+
+    def std(self, ddof=DDOF):
+        """Standard deviation, or NaN when there are too few values"""
+        if self.n <= ddof:
+            return math.nan
+        return math.sqrt(self.m2 / (self.n - ddof))
+
+    def as_tuple(self):
+        return self.n, self.mean, self.m2
+
+    def __repr__(self):
+        return f"RunningStats(n={self.n}, mean={self.mean!r}, std={self.std()!r})"
+
+
+class SeasonDiff:
+    """Players added, removed and changed between two parses of a season"""
+
+    def __init__(self, year, added, removed, changed):
+        self.year = year
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __len__(self):
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def summary(self):
+        return f"{len(self.added)} added, {len(self.removed)} removed, {len(self.changed)} changed"
+
+
+def _row(season, i):
+    cols = season.columns
+    return (cols["Team"][i],) + tuple(cols[name][i] for name in NUMERIC_COLUMNS)
+
+
+def _same(a, b):
+    return all(x == y or (x != x and y != y) for x, y in zip(a, b))
+
+
+def diff_seasons(old, new):
+    """Compare two parses of a season player by player (names are unique within a season)"""
+    old_rows = {name: i for i, name in enumerate(old.columns["Player"])}
+    added, changed = [], []
+    for i, name in enumerate(new.columns["Player"]):
+        j = old_rows.pop(name, None)
+        if j is None:
+            added.append(name)
+        elif not _same(_row(old, j), _row(new, i)):
+            changed.append(name)
+    return SeasonDiff(new.year, added, sorted(old_rows), changed)
+
+
+def metric_values(season):
+    """{metric: values} for the z-score metrics (Eff is the season's Rate or QBR), NaN outside the pool"""
+    cols = season.columns
+    pool = season.qualifying()
+    columns = {"Yds": cols["Yds"], "TD": cols["TD"], "Eff": cols[efficiency_column(season.year)]}
+    return {name: [x if qualifies else math.nan for x, qualifies in zip(values, pool)]
+            for name, values in columns.items()}
+
+
+def update_index(index, old, new):
+    """Bring the leaderboard index from ``old`` to ``new``, touching only what changed.
+
+    Falls back to re-indexing the whole season when the index has no running
+    moments for it (or holds another parser version's rows).  Returns the
+    SeasonDiff.
+    """
+    diff = diff_seasons(old, new)
+    stored = index.season_moments(new.year)
+    if stored is None or index.indexed_years().get(new.year) != PARSER_VERSION:
+        index.update_season(new)
+        return diff
+    if not diff:
+        return diff
+
+    moments = {name: RunningStats(*stored[name]) for name in METRICS}
+    # Values outside the pool are NaN, which RunningStats skips, so passers
+    # crossing the attempts threshold move in or out of the moments on their own
+    old_values, new_values = metric_values(old), metric_values(new)
+    old_rows = {name: i for i, name in enumerate(old.columns["Player"])}
+    new_rows = {name: i for i, name in enumerate(new.columns["Player"])}
+    old_pool = {name for name, qualifies in zip(old.columns["Player"], old.qualifying()) if qualifies}
+    new_pool = {name for name, qualifies in zip(new.columns["Player"], new.qualifying()) if qualifies}
+    for name in METRICS:
+        stats = moments[name]
+        for player in diff.removed:
+            stats.remove(old_values[name][old_rows[player]])
+        for player in diff.changed:
+            stats.replace(old_values[name][old_rows[player]], new_values[name][new_rows[player]])
+        for player in diff.added:
+            stats.add(new_values[name][new_rows[player]])
+
+    # Only passers in the pool are indexed
+    index.apply_season_changes(
+        new,
+        removed=sorted(old_pool - new_pool),
+        updated=[new_rows[player] for player in diff.changed if player in old_pool and player in new_pool],
+        added=[new_rows[player] for player in new.columns["Player"] if player in new_pool and player not in old_pool],
+        moments={name: (stats.as_tuple(), stats.std()) for name, stats in moments.items()},
+    )
+    return diff
@@ -0,0 +1,104 @@
+"""Streaming extraction of the passing table from a Pro-Football-Reference page.
+
+The season pages are several hundred KB, but the only part we need is the
+``<table id="passing">`` block.  ``PassingTableParser`` skips ahead to that
+table with a plain substring search, tokenizes it in a single pass and stops
+consuming input as soon as the table closes, so it works the same whether the
+text comes from the cache file or is still arriving from the network.
+"""
+import re
+from html import unescape
+
+CHUNK_SIZE = 64 * 1024
+
+# Bump whenever parsing or the column mapping changes so that parsed seasons
+# cached by an older version are rebuilt from the HTML.
+PARSER_VERSION = 4
+
+# One scan over the table: each match is either a complete row or one of the
+# structural tags that tell us where the header ends and the table closes.
+_TOKEN_RE = re.compile(r'<tr\b([^>]*)>(.*?)</tr>|<(/?)(thead|table)\b[^>]*>', re.DOTALL | re.IGNORECASE)
+_CELL_RE = re.compile(r'<t[dh]\b[^>]*>(.*?)</t[dh]>', re.DOTALL | re.IGNORECASE)
+_INNER_TAG_RE = re.compile(r'<[^>]*>')
+_DATA_STAT_RE = re.compile(r'<t[dh]\b[^>]*?data-stat="([^"]*)"', re.IGNORECASE)
+
+
+def clean_cell(text):
+    """Strip markup and entities from the raw contents of a table cell"""
+    if "<" in text:
+        text = _INNER_TAG_RE.sub("", text)
+    if "&" in text:
+        text = unescape(text).replace("\xa0", " ")
+    return text.strip()
+
+
+class PassingTableParser:
+    """Incremental tokenizer for the passing stats table.
+
+    Call ``feed`` with successive chunks of the page; each call returns the
+    body rows (tuples of cleaned cell text) completed by that chunk.  Header
+    rows are not returned, but the ``data-stat`` names of the ``<thead>`` row
+    are kept in ``header``.  Once the table has closed ``done`` is set and
+    further input is ignored.
+    """
+
+    def __init__(self, table_id="passing"):
+        self.marker = f'id="{table_id}"'
+        self.header = []
+        self.found = False
+        self.done = False
+        self.chars_read = 0
+        self._buf = ""
+        self._in_thead = False
+
+    def feed(self, chunk):
+        if self.done:
+            return []
+        self.chars_read += len(chunk)
+        buf = self._buf + chunk if self._buf else chunk
+
+        if not self.found:
+            start = buf.find(self.marker)
+            if start < 0:
+                # Keep just enough to catch a marker split across two chunks
+                self._buf = buf[-len(self.marker):]
+                return []
+            end = buf.find(">", start)
+            if end < 0:
+                self._buf = buf[start:]
+                return []
+            self.found = True
+            buf = buf[end + 1:]
+
+        rows = []
+        pos = 0
+        for m in _TOKEN_RE.finditer(buf):
+            pos = m.end()
+            body = m.group(2)
+            if body is not None:
+                if self._in_thead:
+                    stats = _DATA_STAT_RE.findall(body)
+                    if any(stats):
+                        self.header = stats
+                    continue
+                # Repeated header and group-heading rows inside the body
+                attrs = m.group(1)
+                if 'class="thead"' in attrs or 'class="over_header"' in attrs:
+                    continue
+                rows.append(tuple([clean_cell(c) for c in _CELL_RE.findall(body)]))
+            elif m.group(4).lower() == "thead":
+                self._in_thead = not m.group(3)
+            elif m.group(3):
+                # </table>: nothing after this point is needed
+                self.done = True
+                self._buf = ""
+                return rows
+
+        # Carry over the unfinished row (or tag) at the end of this chunk
+        self._buf = buf[pos:]
+        return rows
+
+
+def iter_file_chunks(f, size=CHUNK_SIZE):
+    """Read a text file in fixed-size chunks so parsing can stop early"""
+    return iter(lambda: f.read(size), "")
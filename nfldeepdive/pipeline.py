@@ -0,0 +1,180 @@
+"""Fetch, parse and score a season outside of the UI.
+
+Every stage checks ``cancel`` (a ``threading.Event``) between steps and
+reports what it is doing through ``progress``, so the Tk app can run the
+whole thing on a worker thread and drop results it no longer wants.
+"""
+import os
+import sqlite3
+
+from nfldeepdive.fetch import Cancelled, check_cancelled, fetch_passing_table, revalidate_page
+from nfldeepdive.htmlcache import PageCache
+from nfldeepdive.instrument import count, span
+from nfldeepdive.leaderboard import LeaderboardIndex
+from nfldeepdive.schema import compile_extractor
+from nfldeepdive.season import TOP_N, Season
+from nfldeepdive.store import SeasonStore
+from nfldeepdive.tablemodel import season_model
+
+__all__ = ["Cancelled", "extract_players", "load_season", "refresh_season", "season_from_table", "season_table"]
+
+
+def extract_players(rows, year_int, header=None):
+    """Turn raw table rows into one PlayerSeason per player, merging multi-team rows.
+
+    Columns are located through the era schema, from the table's ``header``
+    (its data-stat names) when given.  A player's multi-team aggregate row
+    (2TM, 3TM, ...) replaces any single-team row seen before it; otherwise
+    the first row seen for a player is kept.  Every passer is kept, however
+    few attempts: the minimum-attempts rule is applied when scoring.
+    """
+    extract = compile_extractor(year_int, header)
+    min_cells = extract.min_cells
+    players = []
+    index = {}  # player name -> position in players
+
+    # Header and separator rows are already dropped by the parser
+    for cols in rows:
+        # Only show players, not team totals (which have no rank)
+        if len(cols) < min_cells or not cols[0]:
+            continue
+        record = extract(cols)
+
+        # Skip records where player name is "Player" or empty
+        player_name = record.player
+        if player_name.lower() == "player" or not player_name.strip():
+            continue
+
+        existing = index.get(player_name)
+        if existing is None:
+            index[player_name] = len(players)
+            players.append(record)
+        elif record.is_multi_team and not players[existing].is_multi_team:
+            players[existing] = record
+    return players
+
+
+def season_from_table(table, rows, year):
+    """Build the Season from a parsed passing table, raising if the page has no usable table"""
+    if not table.found:
+        raise Exception("Could not find passing stats table for this year.")
+    with span("parse.players"):
+        players = extract_players(rows, year, table.header)
+    count("players", len(players))
+    if not players:
+        raise Exception("No player data found for this year.")
+    with span("parse.season"):
+        return Season.from_records(year, players)
+
+
+def load_season(year, cache_dir, cancel=None, progress=None, fetcher=None):
+    """Return the parsed Season, preferring the binary cache over the HTML.
+
+    A parsed season that is still in progress is only reused as is while its
+    page is fresh; after that the page is revalidated and, if it changed, the
+    season is re-parsed and applied to the leaderboard index incrementally.
+    """
+    year_int = int(year)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Parsed seasons load straight from the binary cache without touching HTML
+    store = SeasonStore(cache_dir)
+    pages = PageCache(cache_dir)
+    with span("store.load"):
+        season = store.load(year_int)
+    if season is not None and pages.is_fresh(year_int):
+        count("parsed_cache_hit")
+        return season
+
+    if season is not None:
+        count("parsed_cache_stale")
+        return _revalidate(year_int, cache_dir, store, pages, season, cancel, progress, fetcher)[0]
+
+    count("parsed_cache_miss")
+    with span("fetch"):
+        table, rows = fetch_passing_table(year_int, pages, cancel, progress, fetcher)
+    check_cancelled(cancel)
+    if progress:
+        progress("Parsing player rows")
+    season = season_from_table(table, rows, year_int)
+    _save(store, season)
+
+    # Keep the all-time leaderboard in step with the newly parsed season
+    try:
+        with span("leaderboard.update"):
+            LeaderboardIndex(cache_dir).update_season(season)
+    except sqlite3.Error:
+        pass
+    return season
+
+
+def refresh_season(year, cache_dir, cancel=None, progress=None, fetcher=None):
+    """Ask the site for changes to a season now, however recently it was checked.
+
+    Returns (season, diff): ``diff`` is the SeasonDiff that was applied (every
+    player counts as added when the season was not cached yet), or None when
+    the page had not changed.  Meant for watching a season in progress on a
+    schedule.
+    """
+    from nfldeepdive.live import SeasonDiff
+
+    year_int = int(year)
+    store = SeasonStore(cache_dir)
+    with span("store.load"):
+        season = store.load(year_int)
+    if season is None:
+        season = load_season(year_int, cache_dir, cancel, progress, fetcher)
+        return season, SeasonDiff(year_int, list(season.columns["Player"]), [], [])
+    return _revalidate(year_int, cache_dir, store, PageCache(cache_dir), season, cancel, progress, fetcher)
+
+
+def _revalidate(year_int, cache_dir, store, pages, stored, cancel, progress, fetcher):
+    """Conditional GET for a parsed season; a changed page is diffed against the stored rows"""
+    with span("fetch.revalidate"):
+        table, rows = revalidate_page(year_int, pages, cancel, progress, fetcher)
+    if table is None or not table.found:
+        return stored, None
+    check_cancelled(cancel)
+    if progress:
+        progress("Parsing player rows")
+    season = season_from_table(table, rows, year_int)
+    _save(store, season)
+
+    from nfldeepdive.live import update_index
+
+    diff = None
+    try:
+        with span("leaderboard.incremental"):
+            diff = update_index(LeaderboardIndex(cache_dir), stored, season)
+        count("rows_changed", len(diff))
+    except sqlite3.Error:
+        pass
+    return season, diff
+
+
+def _save(store, season):
+    try:
+        with span("store.save"):
+            store.save(season)
+    except OSError:
+        pass
+
+
+def season_table(year, cache_dir, cancel=None, progress=None, fetcher=None, top_n=TOP_N):
+    """Run every stage for one season and return a TableModel of the rows to display"""
+    season = load_season(year, cache_dir, cancel, progress, fetcher)
+    check_cancelled(cancel)
+    # Passers under the attempts minimum stay in the season but are not scored or shown
+    count("rows_dropped_min_attempts", len(season) - sum(season.qualifying()))
+
+    # The leaderboard index already holds this season's z-scores; recompute only if it is out of step
+    try:
+        with span("stats.index"):
+            z = LeaderboardIndex(cache_dir).season_scores(season)
+    except sqlite3.Error:
+        z = None
+    count("zscores_from_index" if z is not None else "zscores_computed")
+    if z is None and progress:
+        progress("Computing z-scores")
+    with span("stats.zscores"):
+        return season_model(season, top_n, z)
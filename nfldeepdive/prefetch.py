@@ -0,0 +1,186 @@
+"""Bulk download of every season, politely and resumably.
+
+All requests go through one ``Fetcher`` (one pooled session, one homepage
+warm-up) and its token bucket.  Seasons already in the HTML or parsed cache
+are skipped, and finished seasons are recorded in a progress file so an
+interrupted run picks up where it stopped.
+
+Run it headless with ``python -m nfldeepdive.prefetch``; ``--standin DIR``
+serves the pages in DIR from a local server instead of the real site, and
+``--record DIR`` keeps a copy of every page downloaded so it can be replayed
+through the stand-in later.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from nfldeepdive import DEFAULT_CACHE_DIR
+from nfldeepdive.fetch import BASE_URL, Cancelled, Fetcher, check_cancelled
+from nfldeepdive.htmlcache import PageCache
+from nfldeepdive.pipeline import load_season
+from nfldeepdive.ratelimit import DEFAULT_REQUESTS_PER_MINUTE, SITE_REQUESTS_PER_MINUTE, TokenBucket
+from nfldeepdive.season import FIRST_SEASON, LAST_SEASON
+from nfldeepdive.store import SeasonStore
+
+PROGRESS_FILE = "prefetch_progress.json"
+
+
+class PrefetchProgress:
+    """Seasons finished (and failed) so far, persisted as JSON after every season"""
+
+    def __init__(self, path):
+        self.path = path
+        self.completed = set()
+        self.failed = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.completed = {int(y) for y in data.get("completed", [])}
+            self.failed = {int(y): msg for y, msg in data.get("failed", {}).items()}
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def mark_completed(self, year):
+        self.completed.add(year)
+        self.failed.pop(year, None)
+        self.save()
+
+    def mark_failed(self, year, message):
+        self.failed[year] = message
+        self.save()
+
+    def reset(self):
+        self.completed.clear()
+        self.failed.clear()
+        self.save()
+
+    def save(self):
+        data = {
+            "completed": sorted(self.completed),
+            "failed": {str(y): msg for y, msg in sorted(self.failed.items())},
+        }
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+def is_cached(year, cache_dir, store=None, pages=None):
+    store = store or SeasonStore(cache_dir)
+    pages = pages or PageCache(cache_dir)
+    return os.path.exists(store.path(year)) or pages.has(year)
+
+
+def prefetch_seasons(years, cache_dir, fetcher=None, progress_path=None, cancel=None, on_progress=None):
+    """Make sure every season in ``years`` is cached, returning a summary dict.
+
+    ``on_progress(done, total, year, status)`` is called after each season with
+    status "fetched", "cached", "resumed" or an error message.  Failures are
+    recorded and the run carries on with the next season.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    fetcher = fetcher or Fetcher()
+    progress = PrefetchProgress(progress_path or os.path.join(cache_dir, PROGRESS_FILE))
+    store = SeasonStore(cache_dir)
+    pages = PageCache(cache_dir)
+    summary = {"fetched": [], "cached": [], "failed": {}}
+
+    years = list(years)
+    for done, year in enumerate(years, 1):
+        check_cancelled(cancel)
+        if year in progress.completed and is_cached(year, cache_dir, store, pages):
+            status = "resumed"
+            summary["cached"].append(year)
+        else:
+            # Cached pages are parsed locally without a network request
+            was_cached = is_cached(year, cache_dir, store, pages)
+            try:
+                load_season(year, cache_dir, cancel, fetcher=fetcher)
+            except Cancelled:
+                raise
+            except Exception as e:
+                status = str(e) or e.__class__.__name__
+                progress.mark_failed(year, status)
+                summary["failed"][year] = status
+            else:
+                progress.mark_completed(year)
+                status = "cached" if was_cached else "fetched"
+                summary["cached" if was_cached else "fetched"].append(year)
+        if on_progress:
+            on_progress(done, len(years), year, status)
+    return summary
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Download and cache every NFL passing season.")
+    parser.add_argument("--start", type=int, default=FIRST_SEASON, help="first season (default %(default)s)")
+    parser.add_argument("--end", type=int, default=LAST_SEASON, help="last season (default %(default)s)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="cache directory (default %(default)s)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_REQUESTS_PER_MINUTE,
+                        help=f"requests per minute (default %(default)s, Sports-Reference allows {SITE_REQUESTS_PER_MINUTE})")
+    parser.add_argument("--reset", action="store_true", help="forget saved progress and check every season again")
+    parser.add_argument("--standin", metavar="DIR",
+                        help="serve passing_<year>.html files from DIR on a local server instead of the real site")
+    parser.add_argument("--record", metavar="DIR",
+                        help="save every downloaded page in DIR for replay with --standin "
+                             "(cached seasons are not downloaded, so use a fresh --cache-dir)")
+    args = parser.parse_args(argv)
+    if args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.rate > SITE_REQUESTS_PER_MINUTE and not args.standin:
+        parser.error(f"--rate above {SITE_REQUESTS_PER_MINUTE} gets the client blocked by Sports-Reference; "
+                     "higher rates are only allowed with --standin")
+
+    progress_path = os.path.join(args.cache_dir, PROGRESS_FILE)
+    if args.reset:
+        PrefetchProgress(progress_path).reset()
+
+    server = None
+    base_url = BASE_URL
+    if args.standin:
+        from nfldeepdive.standin import StandInServer
+        server = StandInServer(args.standin).start()
+        base_url = server.base_url
+        print(f"Serving {args.standin} at {base_url}")
+
+    if args.record:
+        from nfldeepdive.recording import RecordingFetcher
+        fetcher = RecordingFetcher(args.record, base_url, TokenBucket(args.rate))
+    else:
+        fetcher = Fetcher(base_url, TokenBucket(args.rate))
+    started = time.monotonic()
+
+    def report(done, total, year, status):
+        print(f"[{done}/{total}] {year}: {status}", flush=True)
+
+    try:
+        summary = prefetch_seasons(range(args.start, args.end + 1), args.cache_dir, fetcher, progress_path,
+                                   on_progress=report)
+    except KeyboardInterrupt:
+        print("Interrupted; run again to resume.")
+        return 130
+    finally:
+        if server is not None:
+            server.stop()
+
+    elapsed = time.monotonic() - started
+    print(
+        f"{len(summary['fetched'])} fetched, {len(summary['cached'])} already cached, "
+        f"{len(summary['failed'])} failed; {fetcher.requests_made} requests in {elapsed:.1f}s"
+    )
+    if args.record:
+        print(f"Recorded {fetcher.recorded} responses in {args.record}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Token-bucket rate limiting for requests to Sports-Reference."""
+import threading
+import time
+
+# Slack for floating point drift when a refill lands exactly on a whole token
+_EPSILON = 1e-9
+
+# Sports-Reference blocks clients that exceed 20 requests per minute; stay a little under it
+SITE_REQUESTS_PER_MINUTE = 20
+DEFAULT_REQUESTS_PER_MINUTE = 18
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate_per_minute`` up to ``burst``.  With
+    the default burst of 1 no sliding 60 second window can ever contain more
+    than ``rate_per_minute + 1`` requests.
+    """
+
+    def __init__(self, rate_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=1, clock=time.monotonic, sleep=time.sleep):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(self.burst)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, cancel=None):
+        """Block until a token is available.
+
+        ``cancel`` is an optional ``threading.Event``; waiting stops early once
+        it is set, in which case False is returned instead of True.
+        """
+        while True:
+            with self.lock:
+                now = self.clock()
+                self._refill(now)
+                if self.tokens >= 1 - _EPSILON:
+                    self.tokens -= 1
+                    return True
+                delay = (1 - self.tokens) / self.rate
+            if cancel is not None:
+                # Wake up promptly if the caller gives up
+                if cancel.wait(delay):
+                    return False
+            else:
+                self.sleep(delay)
@@ -0,0 +1,98 @@
+"""Re-parse every cached season page in parallel and rebuild the derived data.
+
+After a parser fix (or to recover a damaged cache) every parsed season and
+the leaderboard index have to be rebuilt from the cached pages.  Parsing is
+pure CPU work, so seasons are fanned out across a ``ProcessPoolExecutor``:
+
+* workers receive only ``(cache_dir, year)`` and read and decompress the page
+  themselves, so no page text is pickled between processes;
+* each worker sends back the season in its compact binary encoding;
+* years are handed out in chunks to keep the per-task overhead low;
+* a failing season is reported and the batch carries on.
+
+The parent process then writes every parsed season and updates the
+leaderboard index in a single transaction, with the z-scores for all seasons
+computed in one vectorized batch.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from nfldeepdive.fetch import read_cached_table
+from nfldeepdive.htmlcache import PageCache
+from nfldeepdive.leaderboard import LeaderboardIndex
+from nfldeepdive.pipeline import season_from_table
+from nfldeepdive.store import SeasonStore, decode_season, encode_season
+
+
+def parse_cached_season(cache_dir, year):
+    """Worker: parse one cached page, returning (year, encoded season, error message)"""
+    try:
+        table, rows = read_cached_table(PageCache(cache_dir), year)
+        if table is None:
+            raise Exception("No readable cached page.")
+        season = season_from_table(table, rows, year)
+        return year, encode_season(season), None
+    except Exception as e:
+        return year, None, str(e) or e.__class__.__name__
+
+
+def _parse_task(task):
+    return parse_cached_season(*task)
+
+
+def default_chunksize(n_years, workers):
+    # About four chunks per worker balances per-task overhead against uneven page sizes
+    return max(1, n_years // (workers * 4))
+
+
+def rebuild(cache_dir, years=None, workers=None, chunksize=None, on_progress=None):
+    """Re-parse cached pages for ``years`` (default: every cached page) and rebuild derived data.
+
+    ``workers`` defaults to the number of CPUs; 1 parses in this process.
+    ``on_progress(done, total, year, error)`` is called as each season finishes.
+    Returns a summary dict with the rebuilt years, the failures and the timings.
+    """
+    started = time.perf_counter()
+    pages = PageCache(cache_dir)
+    if years is None:
+        years = sorted(year for _, _, year in pages.entries())
+    years = [int(y) for y in years]
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or default_chunksize(len(years), workers)
+    tasks = [(cache_dir, year) for year in years]
+
+    seasons = []
+    failed = {}
+
+    def collect(results):
+        for done, (year, data, error) in enumerate(results, 1):
+            if error is None:
+                seasons.append(decode_season(data, year))
+            else:
+                failed[year] = error
+            if on_progress:
+                on_progress(done, len(tasks), year, error)
+
+    if workers == 1 or len(tasks) <= 1:
+        collect(map(_parse_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            collect(executor.map(_parse_task, tasks, chunksize=chunksize))
+    parsed = time.perf_counter()
+
+    store = SeasonStore(cache_dir)
+    for season in seasons:
+        store.save(season)
+    if seasons:
+        LeaderboardIndex(cache_dir).update_seasons(seasons)
+    finished = time.perf_counter()
+
+    return {
+        "rebuilt": sorted(season.year for season in seasons),
+        "failed": failed,
+        "workers": workers,
+        "chunksize": chunksize,
+        "parse_seconds": parsed - started,
+        "merge_seconds": finished - parsed,
+    }
@@ -0,0 +1,108 @@
+"""Record real responses once and replay them offline.
+
+``RecordingFetcher`` is a ``Fetcher`` that keeps a copy of every successful
+response it receives: the whole body (the normal fetch path stops reading at
+the end of the passing table, so the rest is read first) and the headers
+that matter for caching.  Recordings are written to a directory as a gzip
+body and a JSON sidecar per URL path, e.g. ``years_2023_passing.htm.gz`` and
+``years_2023_passing.htm.json``.
+
+The stand-in server (``nfldeepdive.standin``) serves a recordings directory
+at the same paths with the recorded status and validators, so the fetch path
+can be replayed, timed and load-tested without the real site.  Record with
+``nfldeepdive prefetch --record DIR``, which keeps to the usual rate limit.
+"""
+import gzip
+import json
+import os
+import re
+import time
+from urllib.parse import urlsplit
+
+from nfldeepdive.fetch import BASE_URL, Fetcher
+from nfldeepdive.htmlcache import write_atomic
+
+# Response headers worth replaying; length and encoding describe the original transfer only
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def recording_name(path):
+    """File name stem for a URL path: "/years/2023/passing.htm" -> "years_2023_passing.htm" """
+    path = urlsplit(path).path.strip("/")
+    return _UNSAFE_RE.sub("_", path) or "index"
+
+
+class Recordings:
+    """Directory of recorded responses, keyed by URL path"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def body_path(self, path):
+        return os.path.join(self.directory, recording_name(path) + ".gz")
+
+    def meta_path(self, path):
+        return os.path.join(self.directory, recording_name(path) + ".json")
+
+    def has(self, path):
+        return os.path.exists(self.meta_path(path)) and os.path.exists(self.body_path(path))
+
+    def save(self, url, status, headers, body):
+        os.makedirs(self.directory, exist_ok=True)
+        path = urlsplit(url).path or "/"
+        meta = {
+            "url": url,
+            "path": path,
+            "status": status,
+            "headers": {name: headers[name] for name in RECORDED_HEADERS if name in headers},
+            "recorded": time.time(),
+            "size": len(body),
+        }
+        write_atomic(self.directory, self.body_path(path), gzip.compress(body, compresslevel=6))
+        write_atomic(self.directory, self.meta_path(path), json.dumps(meta, indent=1).encode("utf-8"))
+
+    def load(self, path):
+        """(status, headers, body) recorded for a URL path, or None"""
+        if not self.has(path):
+            return None
+        try:
+            with open(self.meta_path(path), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with gzip.open(self.body_path(path), "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return meta["status"], meta.get("headers", {}), body
+
+    def paths(self):
+        """Every recorded URL path"""
+        paths = []
+        if not os.path.isdir(self.directory):
+            return paths
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith(".json"):
+                try:
+                    with open(os.path.join(self.directory, name), "r", encoding="utf-8") as f:
+                        paths.append(json.load(f)["path"])
+                except (OSError, ValueError, KeyError):
+                    continue
+        return paths
+
+
+class RecordingFetcher(Fetcher):
+    """Fetcher that records every 200 response it receives into ``directory``"""
+
+    def __init__(self, directory, base_url=BASE_URL, limiter=None, pool_size=4):
+        super().__init__(base_url, limiter, pool_size)
+        self.recordings = Recordings(directory)
+        self.recorded = 0
+
+    def request(self, url, cancel=None, **kwargs):
+        resp = super().request(url, cancel, **kwargs)
+        if resp.status_code == 200:
+            # Reading .content buffers the whole body; iter_content then replays it to the parser
+            self.recordings.save(url, resp.status_code, resp.headers, resp.content)
+            self.recorded += 1
+        return resp
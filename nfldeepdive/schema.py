@@ -0,0 +1,136 @@
+"""Column layouts of the passing table, one per era.
+
+Pro-Football-Reference has changed the columns of its season passing table
+over time (first-down and success-rate columns from 1978, QBR from 2006).
+Each era is described here as data: the years it covers, whether it has QBR
+and where every displayed column sits.  ``compile_extractor`` turns a layout
+into a single ``operator.itemgetter`` call, with every stat cell parsed by
+``parse_number``.
+
+Where possible the positions are not taken from the era table at all but
+detected from the ``data-stat`` names of the table header, so a column that
+moves on the site is still found.  The era positions are the fallback when
+the header is missing or does not name every column.
+"""
+from array import array
+from functools import lru_cache
+from operator import itemgetter
+
+from nfldeepdive.season import COLUMNS, NAN, NUMERIC_COLUMNS, QBR_FIRST_YEAR, PlayerSeason, parse_number
+
+# data-stat names that identify each displayed column (older and newer site markup)
+DATA_STATS = {
+    "Player": ("player", "name_display"),
+    "Team": ("team", "team_name_abbr"),
+    "G": ("g", "games"),
+    "GS": ("gs", "games_started"),
+    "Cmp": ("pass_cmp",),
+    "Att": ("pass_att",),
+    "Cmp%": ("pass_cmp_perc", "pass_cmp_pct"),
+    "Yds": ("pass_yds",),
+    "TD": ("pass_td",),
+    "INT": ("pass_int",),
+    "Y/A": ("pass_yds_per_att",),
+    "Y/G": ("pass_yds_per_g",),
+    "Rate": ("pass_rating",),
+    "QBR": ("qbr",),
+}
+
+# Rows shorter than this are totals or malformed rows when the layout comes from the era table
+MIN_CELLS = 28
+
+
+class EraSchema:
+    """Where each displayed column sits in one era's table"""
+
+    def __init__(self, name, first_year, last_year, positions):
+        self.name = name
+        self.first_year = first_year
+        self.last_year = last_year
+        self.positions = positions
+
+    @property
+    def has_qbr(self):
+        return self.first_year is not None and self.first_year >= QBR_FIRST_YEAR
+
+    @property
+    def columns(self):
+        """Displayed columns extracted for this era (QBR only where it exists)"""
+        return COLUMNS if self.has_qbr else COLUMNS[:-1]
+
+    def covers(self, year):
+        return (self.first_year is None or year >= self.first_year) and \
+            (self.last_year is None or year <= self.last_year)
+
+    def __repr__(self):
+        return f"EraSchema({self.name!r})"
+
+
+ERA_SCHEMAS = (
+    # For 1977 and earlier there are no 1D and Succ% columns, so Y/A, Y/G and Rate sit 2 columns to the left
+    EraSchema("1950-1977", None, 1977, {
+        "Player": 1, "Team": 3, "G": 5, "GS": 6, "Cmp": 8, "Att": 9, "Cmp%": 10, "Yds": 11, "TD": 12,
+        "INT": 14, "Y/A": 17, "Y/G": 20, "Rate": 21,
+    }),
+    EraSchema("1978-2005", 1978, QBR_FIRST_YEAR - 1, {
+        "Player": 1, "Team": 3, "G": 5, "GS": 6, "Cmp": 8, "Att": 9, "Cmp%": 10, "Yds": 11, "TD": 12,
+        "INT": 14, "Y/A": 19, "Y/G": 22, "Rate": 23,
+    }),
+    EraSchema("2006-", QBR_FIRST_YEAR, None, {
+        "Player": 1, "Team": 3, "G": 5, "GS": 6, "Cmp": 8, "Att": 9, "Cmp%": 10, "Yds": 11, "TD": 12,
+        "INT": 14, "Y/A": 19, "Y/G": 22, "Rate": 23, "QBR": 24,
+    }),
+)
+
+
+def schema_for_year(year):
+    year = int(year)
+    for schema in ERA_SCHEMAS:
+        if schema.covers(year):
+            return schema
+    raise ValueError(f"No table layout for {year}")
+
+
+def detect_positions(header, columns):
+    """Column positions from the header's data-stat names, or None if any column is missing"""
+    index = {}
+    for i, stat in enumerate(header):
+        index.setdefault(stat, i)
+    positions = {}
+    for name in columns:
+        found = [index[stat] for stat in DATA_STATS[name] if stat in index]
+        if not found:
+            return None
+        positions[name] = found[0]
+    return positions
+
+
+class RowExtractor:
+    """Compiled layout: one itemgetter call picks the cells, which become a PlayerSeason"""
+
+    def __init__(self, schema, positions, min_cells):
+        self.schema = schema
+        self.positions = positions
+        self.min_cells = min_cells
+        columns = schema.columns
+        self.getter = itemgetter(*(positions[name] for name in columns))
+        # Player and Team stay text; stats the era does not have (QBR) are NaN
+        self.padding = [NAN] * (len(NUMERIC_COLUMNS) - (len(columns) - 2))
+
+    def __call__(self, cols):
+        cells = self.getter(cols)
+        values = [parse_number(text) for text in cells[2:]]
+        return PlayerSeason(cells[0], cells[1], array("d", values + self.padding))
+
+
+@lru_cache(maxsize=32)
+def _compile(schema, header):
+    positions = detect_positions(header, schema.columns) if header else None
+    if positions is not None:
+        return RowExtractor(schema, positions, max(positions.values()) + 1)
+    return RowExtractor(schema, schema.positions, MIN_CELLS)
+
+
+def compile_extractor(year, header=None):
+    """The row extractor for a season, using the table header's data-stat names when it has them"""
+    return _compile(schema_for_year(year), tuple(header) if header else None)
@@ -0,0 +1,123 @@
+"""Typed, column-oriented player rows for a single season."""
+import math
+import re
+import unicodedata
+from array import array
+
+TEXT_COLUMNS = ("Player", "Team")
+NUMERIC_COLUMNS = ("G", "GS", "Cmp", "Att", "Cmp%", "Yds", "TD", "INT", "Y/A", "Y/G", "Rate", "QBR")
+COLUMNS = TEXT_COLUMNS + NUMERIC_COLUMNS
+INTEGER_COLUMNS = frozenset(("G", "GS", "Cmp", "Att", "Yds", "TD", "INT"))
+
+# Seasons offered by the app
+FIRST_SEASON = 1950
+LAST_SEASON = 2023
+
+# ESPN's QBR only exists from 2006 on; earlier seasons are rated by passer rating alone
+QBR_FIRST_YEAR = 2006
+
+# Passers shown for a season (the leaders by yards)
+TOP_N = 40
+
+# Passers with fewer attempts are left out of the z-score pool (and the leaderboard) for seasons
+# after 1970; parsed seasons keep every passer, so the threshold can be changed when scoring
+MIN_ATTEMPTS = 100
+MIN_ATTEMPTS_AFTER = 1970
+
+NAN = float("nan")
+
+# Aggregate row of a player who played for several teams: 2TM, 3TM, 4TM, ...
+MULTI_TEAM_RE = re.compile(r"^\d+TM$")
+
+# Award markers the site appends to names: * Pro Bowl, + All-Pro
+NAME_MARKERS = "*+"
+
+_NUMERIC_INDEX = {name: i for i, name in enumerate(NUMERIC_COLUMNS)}
+_NAME_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+def parse_number(text):
+    """Convert a table cell such as "4,806" or "64.2" to a float (NaN when blank or invalid)"""
+    try:
+        return float(text.replace(",", ""))
+    except (ValueError, AttributeError):
+        return NAN
+
+
+def format_number(value, integer=False):
+    """Render a stored number the way the table shows it"""
+    if value is None or math.isnan(value):
+        return ""
+    if integer:
+        return str(int(value))
+    return f"{value:.1f}"
+
+
+def display_name(name):
+    """A player's name without the award markers"""
+    return name.rstrip(NAME_MARKERS).strip()
+
+
+def normalize_name(name):
+    """Key that matches one player's name across seasons: no markers, accents, punctuation or case.
+
+    "Tom Brady*+", "tom brady" and "Tóm Brady" all become "tom brady"; hyphens separate words.
+    """
+    text = unicodedata.normalize("NFKD", display_name(name).replace("-", " "))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(_NAME_PUNCTUATION_RE.sub("", text).lower().split())
+
+
+class PlayerSeason:
+    """One player's season: name and team as text, every stat parsed once into a float array"""
+
+    __slots__ = ("player", "team", "stats")
+
+    def __init__(self, player, team, stats):
+        self.player = player
+        self.team = team
+        self.stats = stats
+
+    def __getitem__(self, name):
+        return self.stats[_NUMERIC_INDEX[name]]
+
+    @property
+    def is_multi_team(self):
+        return MULTI_TEAM_RE.match(self.team) is not None
+
+    def __repr__(self):
+        return f"PlayerSeason({self.player!r}, {self.team!r})"
+
+
+class Season:
+    """Player rows for one season stored as one typed column per stat.
+
+    Text columns are lists of str, numeric columns are ``array('d')`` with NaN
+    marking a missing value.  Numbers are parsed once, when the season is built.
+    """
+
+    def __init__(self, year, columns):
+        self.year = int(year)
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["Player"])
+
+    @property
+    def has_qbr(self):
+        return self.year >= QBR_FIRST_YEAR
+
+    def qualifying(self, min_attempts=MIN_ATTEMPTS):
+        """Whether each row is in the z-score pool: every passer up to 1970, then ``min_attempts`` or more"""
+        if self.year <= MIN_ATTEMPTS_AFTER:
+            return [True] * len(self)
+        # A blank attempts cell counts as none
+        return [att >= min_attempts for att in self.columns["Att"]]
+
+    @classmethod
+    def from_records(cls, year, records):
+        """Build a season from PlayerSeason records, copying their already parsed numbers"""
+        columns = {"Player": [r.player for r in records], "Team": [r.team for r in records]}
+        for i, name in enumerate(NUMERIC_COLUMNS):
+            columns[name] = array("d", [r.stats[i] for r in records])
+        return cls(year, columns)
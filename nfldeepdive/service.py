@@ -0,0 +1,357 @@
+"""Read-only HTTP/JSON query service over every parsed season.
+
+    nfldeepdive serve --port 8765
+
+Every player-season in the parsed cache is loaded once at start, with its
+z-scores, as the same rows ``nfldeepdive export`` writes (``export.dataset_rows``),
+and indexed by season and by player.  Requests are answered from that one
+copy by a thread per connection; nothing is parsed or queried from disk per
+request.  Restart the service to pick up seasons fetched since.
+
+    GET /                                  what is loaded, and the response cache's hit rate
+    GET /seasons                           every season with its number of players
+    GET /seasons/<year>?sort=yds&order=desc&limit=50&offset=0
+    GET /leaderboard?by=total_z&start=&end=&team=&min_att=&limit=25&offset=0
+    GET /players?q=<name>&limit=20         name search, as the Careers window does it
+    GET /players/<name>                    every season of one player
+
+Lists are paginated: a response carries ``total``, ``offset``, ``limit``, the
+``rows`` of that page as objects keyed by the dataset's column names and a
+``next`` link while there are more.  Encoded responses are kept in a small
+LRU cache keyed by the normalized request, and sent with an ETag so clients
+can revalidate with If-None-Match.
+"""
+import json
+import sys
+import threading
+import traceback
+import zlib
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit
+
+from nfldeepdive.careers import SEARCH_LIMIT, CareerIndex
+from nfldeepdive.export import DATASET_COLUMNS, DATASET_SCHEMA, dataset_rows
+from nfldeepdive.leaderboard import RANKABLE
+from nfldeepdive.season import normalize_name
+
+DEFAULT_PORT = 8765
+
+# Encoded responses kept in memory
+RESPONSE_CACHE_SIZE = 512
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+_POSITIONS = {name: i for i, name in enumerate(DATASET_COLUMNS)}
+_TEXT_COLUMNS = frozenset(name for name, kind, _ in DATASET_SCHEMA if kind == "string")
+
+
+class QueryError(Exception):
+    """A request that cannot be answered, with the HTTP status to answer it with"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Dataset:
+    """Every player-season as plain rows, indexed by season and player, with cached sort orders"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.by_year = {}
+        self.by_player = {}
+        for i, row in enumerate(rows):
+            self.by_year.setdefault(row[0], []).append(i)
+            self.by_player.setdefault(row[2], []).append(i)
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cache(cls, cache_dir):
+        return cls(dataset_rows(cache_dir))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def ordered(self, column):
+        """Row indices by ``column``, highest first with blanks last (ties by year), computed once"""
+        with self._lock:
+            order = self._orders.get(column)
+        if order is None:
+            pos = _POSITIONS[column]
+            rows = self.rows
+            if column in _TEXT_COLUMNS:
+                order = sorted(range(len(rows)), key=lambda i: rows[i][pos].lower())
+            else:
+                order = sorted(range(len(rows)),
+                               key=lambda i: (rows[i][pos] is None, -(rows[i][pos] or 0.0), rows[i][0]))
+            with self._lock:
+                self._orders[column] = order
+        return order
+
+    def leaderboard(self, by, start=None, end=None, team=None, min_attempts=None):
+        """Indices of the player-seasons ranked by ``by`` that pass the filters"""
+        rows = self.rows
+        year, team_pos, att = 0, _POSITIONS["team"], _POSITIONS["att"]
+        selected = []
+        for i in self.ordered(by):
+            row = rows[i]
+            if start is not None and row[year] < start:
+                continue
+            if end is not None and row[year] > end:
+                continue
+            if team and row[team_pos] != team:
+                continue
+            if min_attempts and (row[att] is None or row[att] < min_attempts):
+                continue
+            selected.append(i)
+        return selected
+
+    def season(self, year, sort, descending=True):
+        """Indices of one season's players sorted by ``sort``, blanks last either way"""
+        members = set(self.by_year.get(year, ()))
+        order = [i for i in self.ordered(sort) if i in members]
+        # ordered() is highest first for numbers but alphabetical for text
+        if descending == (sort in _TEXT_COLUMNS):
+            pos = _POSITIONS[sort]
+            filled = [i for i in order if self.rows[i][pos] is not None]
+            order = filled[::-1] + order[len(filled):]
+        return order
+
+    def record(self, i):
+        return dict(zip(DATASET_COLUMNS, self.rows[i]))
+
+
+def _int_param(params, name, default=None, minimum=None, maximum=None):
+    value = params.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        raise QueryError(400, f"{name} must be a whole number")
+    if minimum is not None and value < minimum:
+        raise QueryError(400, f"{name} must be at least {minimum}")
+    if maximum is not None and value > maximum:
+        value = maximum
+    return value
+
+
+def _float_param(params, name):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise QueryError(400, f"{name} must be a number")
+
+
+class QueryService:
+    """Routes requests to the dataset and caches the encoded responses"""
+
+    def __init__(self, dataset, careers=None, cache_size=RESPONSE_CACHE_SIZE):
+        self.dataset = dataset
+        self.careers = careers
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+        # CareerIndex builds its token lists lazily, so searches take turns
+        self.search_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_cache(cls, cache_dir, cache_size=RESPONSE_CACHE_SIZE):
+        dataset = Dataset.from_cache(cache_dir)
+        careers = CareerIndex(cache_dir)
+        careers.refresh()
+        return cls(dataset, careers, cache_size)
+
+    def respond(self, target):
+        """(status, JSON body, ETag) for a request target such as "/leaderboard?team=SFO" """
+        parts = urlsplit(target)
+        params = dict(parse_qsl(parts.query))
+        path = parts.path.rstrip("/") or "/"
+        key = path + "?" + urlencode(sorted(params.items()))
+        with self.cache_lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        try:
+            status, payload = 200, self.route(path, params)
+        except QueryError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception as e:
+            # A bug or a bad file in the cache: answer, and leave the traceback on the console
+            print(f"nfldeepdive serve: error answering {target}", file=sys.stderr)
+            traceback.print_exc()
+            status, payload = 500, {"error": f"Internal error: {e.__class__.__name__}"}
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        response = (status, body, f'"{zlib.crc32(body):08x}-{len(body):x}"')
+        if status == 200 and path != "/":
+            with self.cache_lock:
+                self.cache[key] = response
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        return response
+
+    def route(self, path, params):
+        parts = [unquote(part) for part in path.strip("/").split("/")] if path != "/" else []
+        if not parts:
+            return self.overview()
+        if parts[0] == "seasons" and len(parts) == 1:
+            return self.seasons()
+        if parts[0] == "seasons" and len(parts) == 2:
+            if not parts[1].isdigit():
+                raise QueryError(404, f"No season {parts[1]!r}")
+            return self.season(int(parts[1]), params)
+        if parts[0] == "leaderboard" and len(parts) == 1:
+            return self.leaderboard(params)
+        if parts[0] == "players" and len(parts) == 1:
+            return self.search(params)
+        if parts[0] == "players" and len(parts) == 2:
+            return self.player(parts[1])
+        raise QueryError(404, f"No such resource: {path}")
+
+    def page(self, path, params, indices, default_limit=DEFAULT_PAGE_SIZE):
+        """One page of ``indices`` as records, with a link to the next page"""
+        limit = _int_param(params, "limit", default_limit, minimum=1, maximum=MAX_PAGE_SIZE)
+        offset = _int_param(params, "offset", 0, minimum=0)
+        following = None
+        if offset + limit < len(indices):
+            query = dict(params, offset=offset + limit, limit=limit)
+            following = path + "?" + urlencode(sorted(query.items()))
+        return {
+            "total": len(indices),
+            "offset": offset,
+            "limit": limit,
+            "next": following,
+            "rows": [self.dataset.record(i) for i in indices[offset:offset + limit]],
+        }
+
+    def overview(self):
+        with self.cache_lock:
+            hits, misses, cached = self.hits, self.misses, len(self.cache)
+        return {
+            "player_seasons": len(self.dataset),
+            "seasons": sorted(self.dataset.by_year),
+            "players": len(self.dataset.by_player),
+            "columns": [{"name": name, "type": kind} for name, kind, _ in DATASET_SCHEMA],
+            "cache": {"responses": cached, "hits": hits, "misses": misses},
+            "endpoints": ["/seasons", "/seasons/<year>", "/leaderboard", "/players?q=<name>", "/players/<name>"],
+        }
+
+    def seasons(self):
+        return {
+            "seasons": [
+                {"year": year, "players": len(rows), "url": f"/seasons/{year}"}
+                for year, rows in sorted(self.dataset.by_year.items())
+            ]
+        }
+
+    def season(self, year, params):
+        if year not in self.dataset.by_year:
+            raise QueryError(404, f"Season {year} is not in the cache")
+        sort = params.get("sort", "yds")
+        if sort not in _POSITIONS:
+            raise QueryError(400, f"Cannot sort by {sort!r}")
+        order = params.get("order", "desc")
+        if order not in ("asc", "desc"):
+            raise QueryError(400, "order must be asc or desc")
+        indices = self.dataset.season(year, sort, order == "desc")
+        return dict(self.page(f"/seasons/{year}", params, indices), year=year)
+
+    def leaderboard(self, params):
+        by = params.get("by", "total_z")
+        if by not in RANKABLE:
+            raise QueryError(400, f"Cannot rank by {by!r}")
+        team = params.get("team", "").upper() or None
+        indices = self.dataset.leaderboard(
+            by, _int_param(params, "start"), _int_param(params, "end"), team, _float_param(params, "min_att"),
+        )
+        return dict(self.page("/leaderboard", params, indices, default_limit=25), by=by)
+
+    def search(self, params):
+        query = params.get("q", "")
+        if not normalize_name(query):
+            raise QueryError(400, "q must contain a name")
+        if self.careers is None:
+            raise QueryError(404, "Name search is not available")
+        limit = _int_param(params, "limit", SEARCH_LIMIT, minimum=1, maximum=MAX_PAGE_SIZE)
+        with self.search_lock:
+            matches = self.careers.search(query, limit, refresh=False)
+        return {
+            "query": query,
+            "players": [
+                {"name": m.name, "key": m.key, "first_year": m.first_year, "last_year": m.last_year,
+                 "seasons": len(m), "url": "/players/" + quote(m.key)}
+                for m in matches
+            ],
+        }
+
+    def player(self, name):
+        key = normalize_name(name)
+        indices = self.dataset.by_player.get(key)
+        if not indices:
+            raise QueryError(404, f"No player {name!r} in the cache")
+        # Rows are loaded season by season, so a player's are already oldest first
+        return {"key": key, "seasons": [self.dataset.record(i) for i in indices]}
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status, body, etag = self.server.service.respond(self.path)
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ServiceServer(ThreadingHTTPServer):
+    """Threaded query server; use as a context manager to run it in the background"""
+
+    daemon_threads = True
+
+    def __init__(self, service, host="127.0.0.1", port=DEFAULT_PORT):
+        super().__init__((host, port), ServiceHandler)
+        self.service = service
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
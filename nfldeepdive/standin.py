@@ -0,0 +1,231 @@
+"""Local stand-in for Pro-Football-Reference.
+
+Serves season pages from a directory at the same paths as the real site, so
+the fetcher, rate limiter and prefetcher can be exercised and timed without
+sending a single request to Sports-Reference.  The directory can hold
+``passing_<year>.html`` files, responses recorded with
+``nfldeepdive prefetch --record`` (see ``nfldeepdive.recording``), or both;
+a recording wins.
+
+``Faults`` makes season pages misbehave the way the real site sometimes
+does: added latency, 403/429 responses (429 with a Retry-After) and bodies
+cut off partway through.  Faults are drawn from a seeded random generator,
+so a run with the same seed and request order sees the same faults.
+
+    python -m nfldeepdive.standin DIR --port 8000 --latency 0.2 --error-rate 0.1 --truncate-rate 0.05
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nfldeepdive.recording import Recordings
+
+_SEASON_PATH_RE = re.compile(r"^/years/(\d{4})/passing\.htm$")
+_PAGE_FILE_RE = re.compile(r"^passing_(\d{4})\.html$")
+
+HOME_PAGE = b"<html><head><title>Pro-Football-Reference stand-in</title></head><body></body></html>"
+
+
+def season_years(pages_dir):
+    """Every year ``pages_dir`` has a page or recording for"""
+    years = set()
+    for path in Recordings(pages_dir).paths():
+        m = _SEASON_PATH_RE.match(path)
+        if m:
+            years.add(int(m.group(1)))
+    for name in os.listdir(pages_dir):
+        m = _PAGE_FILE_RE.match(name)
+        if m:
+            years.add(int(m.group(1)))
+    return sorted(years)
+
+
+class Faults:
+    """Latency, error responses and truncated bodies injected into season pages.
+
+    ``latency`` (plus up to ``jitter`` more) seconds are slept before every
+    response; ``error_rate`` of responses are ``error_status`` instead of the
+    page; ``truncate_rate`` of pages stop halfway through the body.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=429, truncate_rate=0.0,
+                 retry_after=1, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.truncate_rate = truncate_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def draw(self):
+        """(delay, error, truncate) for the next season page"""
+        with self.lock:
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            error = self.random.random() < self.error_rate
+            truncate = not error and self.random.random() < self.truncate_rate
+        return delay, error, truncate
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.record(self.path)
+        if self.path == "/":
+            self.send_body(200, HOME_PAGE)
+            return
+
+        response = server.season_response(self.path)
+        if response is None:
+            self.send_body(404, b"Not Found")
+            return
+        status, validators, body = response
+
+        truncate = False
+        if server.faults is not None:
+            delay, error, truncate = server.faults.draw()
+            if delay:
+                time.sleep(delay)
+            if error:
+                status = server.faults.error_status
+                headers = {"Retry-After": str(server.faults.retry_after)} if status == 429 else None
+                self.send_body(status, HTTPStatus(status).phrase.encode("ascii"), headers)
+                return
+
+        etag = validators.get("ETag")
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_body(304, b"", validators)
+            return
+        self.send_body(status, body, validators, truncate)
+
+    def send_body(self, status, body, headers=None, truncate=False):
+        headers = dict(headers or {})
+        content_type = headers.pop("Content-Type", "text/html; charset=utf-8")
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if truncate:
+            # Promise the whole body, send half of it and hang up
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand-in server; use as a context manager to run it in the background"""
+
+    daemon_threads = True
+
+    def __init__(self, pages_dir, host="127.0.0.1", port=0, faults=None):
+        super().__init__((host, port), StandInHandler)
+        self.pages_dir = pages_dir
+        self.recordings = Recordings(pages_dir)
+        self.faults = faults
+        self.requests = []
+        self.requests_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def season_response(self, path):
+        """(status, headers, body) for a season path, from a recording or a page file, or None"""
+        m = _SEASON_PATH_RE.match(path)
+        if m is None:
+            return None
+        recorded = self.recordings.load(path)
+        if recorded is not None:
+            status, headers, body = recorded
+            if "ETag" not in headers:
+                headers = dict(headers, ETag=f'"{len(body):x}-{zlib.crc32(body):x}"')
+            return status, headers, body
+        page = os.path.join(self.pages_dir, f"passing_{m.group(1)}.html")
+        if not os.path.exists(page):
+            return None
+        # Validators derived from the file, so conditional GETs behave like the real site
+        stat = os.stat(page)
+        validators = {
+            "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        }
+        with open(page, "rb") as f:
+            return 200, validators, f.read()
+
+    def record(self, path):
+        with self.requests_lock:
+            self.requests.append((time.monotonic(), path))
+
+    def handle_error(self, request, client_address):
+        # Clients hang up as soon as they have the passing table; that is expected
+        pass
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m nfldeepdive.standin",
+                                     description="Serve season pages or recordings from a local stand-in server.")
+    parser.add_argument("pages_dir", metavar="DIR", help="passing_<year>.html files and/or recorded responses")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default %(default)s)")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on (default %(default)s)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every season page")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more seconds, at random")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of season pages answered with an error")
+    parser.add_argument("--error-status", type=int, default=429, choices=(403, 429, 503),
+                        help="status of those errors (default %(default)s)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429 (default %(default)s)")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="share of season pages cut off halfway")
+    parser.add_argument("--seed", type=int, default=0, help="seed for drawing faults (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    faults = None
+    if args.latency or args.jitter or args.error_rate or args.truncate_rate:
+        faults = Faults(args.latency, args.jitter, args.error_rate, args.error_status, args.truncate_rate,
+                        args.retry_after, args.seed)
+    server = StandInServer(args.pages_dir, args.host, args.port, faults)
+    print(f"Serving {args.pages_dir} at {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Vectorized z-score engine.
+
+Population choices, applied the same way to every metric and every season:
+
+* the pool is every qualifying passer of the season (after the multi-team
+  merge), not just the top 40 that is displayed: every passer up to 1970,
+  then those with at least ``min_attempts`` (``season.MIN_ATTEMPTS`` unless
+  given).  Passers outside the pool get a z-score of 0 and are not indexed;
+* the standard deviation is the sample standard deviation (``ddof=1``), as
+  ``statistics.stdev`` used to compute it;
+* missing values (blank cells, e.g. QBR before 2006) are left out of the mean
+  and standard deviation and get a z-score of 0, as does every player of a
+  season whose standard deviation is 0 or undefined.
+
+The efficiency metric is passer rating before 2006 and QBR from 2006 on; the
+total z-score is yards + touchdowns + efficiency.
+"""
+import numpy as np
+
+from nfldeepdive.season import MIN_ATTEMPTS, MIN_ATTEMPTS_AFTER, QBR_FIRST_YEAR
+
+DDOF = 1
+METRICS = ("Yds", "TD", "Eff")
+
+
+def efficiency_column(year):
+    return "QBR" if int(year) >= QBR_FIRST_YEAR else "Rate"
+
+
+def column_array(season, name):
+    """Zero-copy float64 view of one of the season's numeric columns"""
+    values = season.columns[name]
+    if len(values) == 0:
+        return np.empty(0)
+    return np.frombuffer(values, dtype=np.float64)
+
+
+class SeasonZScores:
+    """Per-metric and total z-scores for one season, aligned with the season's rows"""
+
+    def __init__(self, year, efficiency, pool, values, z, mean, std):
+        self.year = year
+        self.efficiency = efficiency
+        self.pool = pool
+        self.values = values
+        self.z = z
+        self.mean = mean
+        self.std = std
+        self.total = z["Yds"] + z["TD"] + z["Eff"]
+
+    def __len__(self):
+        return len(self.total)
+
+
+def grouped_zscores(values, groups, n_groups, ddof=DDOF):
+    """z-scores of ``values`` within each group, in one pass over the flat array.
+
+    Returns (z, mean, std) where mean and std have one entry per group.
+    """
+    finite = np.isfinite(values)
+    x = np.where(finite, values, 0.0)
+    count = np.bincount(groups, weights=finite, minlength=n_groups)
+    total = np.bincount(groups, weights=x, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        dev = np.where(finite, x - mean[groups], 0.0)
+        sq = np.bincount(groups, weights=dev * dev, minlength=n_groups)
+        std = np.sqrt(sq / (count - ddof))
+    std = np.where(count > ddof, std, np.nan)
+    scale = std[groups]
+    usable = finite & (scale > 0)
+    z = np.zeros_like(x)
+    np.divide(dev, scale, out=z, where=usable)
+    return z, mean, std
+
+
+def pool_mask(season, min_attempts=MIN_ATTEMPTS):
+    """Boolean array of the rows in a season's z-score pool (see Season.qualifying)"""
+    if season.year <= MIN_ATTEMPTS_AFTER:
+        return np.ones(len(season), dtype=bool)
+    # NaN (a blank cell) compares False, so no attempts on record means out of the pool
+    return column_array(season, "Att") >= min_attempts
+
+
+def score_seasons(seasons, ddof=DDOF, min_attempts=MIN_ATTEMPTS):
+    """Compute z-scores for many seasons at once, returning one SeasonZScores per season.
+
+    ``values`` of each result hold NaN for passers outside the pool.
+    """
+    seasons = list(seasons)
+    if not seasons:
+        return []
+    counts = np.array([len(s) for s in seasons])
+    groups = np.repeat(np.arange(len(seasons)), counts)
+    bounds = np.cumsum(counts)[:-1]
+
+    pool = np.concatenate([pool_mask(s, min_attempts) for s in seasons])
+    flat = {
+        "Yds": np.concatenate([column_array(s, "Yds") for s in seasons]),
+        "TD": np.concatenate([column_array(s, "TD") for s in seasons]),
+        "Eff": np.concatenate([column_array(s, efficiency_column(s.year)) for s in seasons]),
+    }
+    flat = {name: np.where(pool, values, np.nan) for name, values in flat.items()}
+    results = {name: grouped_zscores(values, groups, len(seasons), ddof) for name, values in flat.items()}
+
+    split = {name: np.split(values, bounds) for name, values in flat.items()}
+    split_pool = np.split(pool, bounds)
+    split_z = {name: np.split(results[name][0], bounds) for name in METRICS}
+    scores = []
+    for i, season in enumerate(seasons):
+        scores.append(SeasonZScores(
+            season.year,
+            efficiency_column(season.year),
+            split_pool[i],
+            {name: split[name][i] for name in METRICS},
+            {name: split_z[name][i] for name in METRICS},
+            {name: float(results[name][1][i]) for name in METRICS},
+            {name: float(results[name][2][i]) for name in METRICS},
+        ))
+    return scores
+
+
+def score_season(season, ddof=DDOF, min_attempts=MIN_ATTEMPTS):
+    return score_seasons([season], ddof, min_attempts)[0]
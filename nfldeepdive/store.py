@@ -0,0 +1,119 @@
+"""Binary cache of parsed seasons.
+
+Each season is written to ``cache/parsed/passing_<year>.v<parser version>.bin``
+as a small header followed by one block per column: text columns as a single
+length-prefixed UTF-8 string, numeric columns as raw little-endian float64
+arrays.  Loading a season is a single read plus ``array.frombytes`` per column,
+so it never touches the HTML again.  Files written by another parser version
+are ignored and cleaned up, which makes a parser change invalidate the cache.
+"""
+import glob
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from nfldeepdive.parser import PARSER_VERSION
+from nfldeepdive.season import COLUMNS, TEXT_COLUMNS, Season
+
+MAGIC = b"NFLS"
+FORMAT_VERSION = 1
+
+# magic, format version, parser version, year, row count
+_HEADER = struct.Struct("<4sHHHI")
+_LENGTH = struct.Struct("<I")
+_SEPARATOR = "\n"
+
+
+class SeasonStore:
+    """Parsed-season cache keyed by year and parser version"""
+
+    def __init__(self, cache_dir):
+        self.directory = os.path.join(cache_dir, "parsed")
+
+    def path(self, year):
+        return os.path.join(self.directory, f"passing_{int(year)}.v{PARSER_VERSION}.bin")
+
+    def years(self):
+        """Years that have a parsed season for the current parser version"""
+        suffix = f".v{PARSER_VERSION}.bin"
+        years = []
+        for path in glob.glob(os.path.join(self.directory, "passing_*" + suffix)):
+            name = os.path.basename(path)[len("passing_"):-len(suffix)]
+            if name.isdigit():
+                years.append(int(name))
+        return sorted(years)
+
+    def load(self, year):
+        """Return the cached Season, or None if it is missing, stale or unreadable"""
+        try:
+            with open(self.path(year), "rb") as f:
+                data = f.read()
+            return decode_season(data, year)
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
+            return None
+
+    def save(self, season):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(season.year)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        try:
+            with open(fd, "wb") as f:
+                f.write(encode_season(season))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        # Drop files left behind by older parser versions
+        for old in glob.glob(os.path.join(self.directory, f"passing_{season.year}.v*.bin")):
+            if old != path:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+
+def encode_season(season):
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, PARSER_VERSION, season.year, len(season))]
+    for name in COLUMNS:
+        values = season.columns[name]
+        if name in TEXT_COLUMNS:
+            blob = _SEPARATOR.join(values).encode("utf-8")
+            parts.append(_LENGTH.pack(len(blob)))
+            parts.append(blob)
+        else:
+            values = array("d", values)
+            if sys.byteorder != "little":
+                values.byteswap()
+            parts.append(values.tobytes())
+    return b"".join(parts)
+
+
+def decode_season(data, year):
+    magic, fmt, version, stored_year, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or fmt != FORMAT_VERSION or version != PARSER_VERSION or stored_year != int(year):
+        raise ValueError("stale or foreign season file")
+
+    view = memoryview(data)
+    offset = _HEADER.size
+    columns = {}
+    for name in COLUMNS:
+        if name in TEXT_COLUMNS:
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            text = bytes(view[offset:offset + length]).decode("utf-8")
+            offset += length
+            columns[name] = text.split(_SEPARATOR) if count else []
+        else:
+            end = offset + count * 8
+            values = array("d")
+            values.frombytes(view[offset:end])
+            if sys.byteorder != "little":
+                values.byteswap()
+            offset = end
+            columns[name] = values
+        if len(columns[name]) != count:
+            raise ValueError("truncated season file")
+    return Season(stored_year, columns)
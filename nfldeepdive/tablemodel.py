@@ -0,0 +1,122 @@
+"""In-memory model behind the results tables.
+
+Rows are kept as typed tuples (text as str, numbers as float with NaN for a
+blank cell).  Sorting a column computes its ascending permutation once and
+caches it, so flipping direction or coming back to a column is free, and the
+view only ever asks for the handful of rows it is currently showing.
+"""
+import math
+
+from nfldeepdive.season import INTEGER_COLUMNS, QBR_FIRST_YEAR, TOP_N, format_number
+
+BASE_COLUMNS = ("Player", "Team", "G", "GS", "Cmp", "Att", "Cmp%", "Yds", "TD", "INT", "Y/A", "Y/G", "Rate")
+RATE_ERA_COLUMNS = BASE_COLUMNS + ("Yds Z-Score", "TD Z-Score", "Rate Z-Score", "Total Z-Score")
+QBR_ERA_COLUMNS = BASE_COLUMNS + ("QBR", "Yds Z-Score", "TD Z-Score", "QBR Z-Score", "Total Z-Score")
+
+# Every column either era can show, so one widget can serve both by switching displaycolumns
+ALL_SEASON_COLUMNS = BASE_COLUMNS + ("QBR", "Yds Z-Score", "TD Z-Score", "Rate Z-Score", "QBR Z-Score", "Total Z-Score")
+
+
+def season_columns(year):
+    """Table columns for a season: QBR and its z-score only exist from 2006 on"""
+    return QBR_ERA_COLUMNS if int(year) >= QBR_FIRST_YEAR else RATE_ERA_COLUMNS
+
+
+def format_cell(column, value):
+    if isinstance(value, str):
+        return value
+    if column.endswith("Score"):
+        return f"{value:.2f}"
+    if isinstance(value, int):
+        return str(value)
+    return format_number(value, column in INTEGER_COLUMNS)
+
+
+class TableModel:
+    """Typed rows with cached per-column sort permutations"""
+
+    def __init__(self, columns, rows):
+        self.columns = tuple(columns)
+        self.rows = rows
+        self.positions = {name: i for i, name in enumerate(self.columns)}
+        self.order = list(range(len(rows)))
+        self.sort_column = None
+        self.sort_reverse = False
+        self._ascending = {}
+        self._blanks = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def sorted_indices(self, column):
+        """Ascending row permutation for ``column``, computed once per column"""
+        order = self._ascending.get(column)
+        if order is None:
+            pos = self.positions[column]
+            rows = self.rows
+            blanks = 0
+            if rows and isinstance(rows[0][pos], str):
+                order = sorted(range(len(rows)), key=lambda i: rows[i][pos].lower())
+            else:
+                # Blank numbers always sort after real ones
+                def key(i):
+                    value = rows[i][pos]
+                    if value is None or value != value:
+                        return (True, 0)
+                    return (False, value)
+                order = sorted(range(len(rows)), key=key)
+                blanks = sum(1 for i in order if key(i)[0])
+            self._ascending[column] = order
+            self._blanks[column] = blanks
+        return order
+
+    def sort(self, column, reverse=False):
+        order = self.sorted_indices(column)
+        if reverse:
+            # Keep blanks at the bottom in both directions
+            filled = len(order) - self._blanks[column]
+            order = order[filled - 1::-1] + order[filled:] if filled else list(order)
+        self.order = order
+        self.sort_column = column
+        self.sort_reverse = reverse
+
+    def row(self, position):
+        """Typed row shown at ``position`` in the current sort order"""
+        return self.rows[self.order[position]]
+
+    def display_row(self, position):
+        return tuple(format_cell(col, value) for col, value in zip(self.columns, self.row(position)))
+
+    def display_rows(self, start=0, stop=None):
+        stop = len(self.rows) if stop is None else min(stop, len(self.rows))
+        return [self.display_row(i) for i in range(start, stop)]
+
+
+def top_by_yards(season, n=TOP_N):
+    """Row indices of the top ``n`` passers in the z-score pool by yards, highest first (stable for ties, blanks last)"""
+    yards = season.columns["Yds"]
+    pool = [i for i, qualifies in enumerate(season.qualifying()) if qualifies]
+    return sorted(pool, key=lambda i: -yards[i] if yards[i] == yards[i] else math.inf)[:n]
+
+
+def season_model(season, top_n=TOP_N, z=None):
+    """Model of the top ``top_n`` passers by yards with their z-scores.
+
+    ``z`` is an optional (yds_z, td_z, eff_z, total_z) tuple of columns aligned
+    with the season's rows, such as LeaderboardIndex.season_scores returns;
+    without it the z-scores are computed here.
+    """
+    if z is None:
+        from nfldeepdive.stats import score_season
+        scores = score_season(season)
+        z = (scores.z["Yds"], scores.z["TD"], scores.z["Eff"], scores.total)
+    yds_z, td_z, eff_z, total_z = z
+    cols = season.columns
+    stat_names = season_columns(season.year)[:-4]
+    stat_columns = [cols[name] for name in stat_names]
+    rows = [
+        tuple(column[i] for column in stat_columns)
+        + (float(yds_z[i]), float(td_z[i]), float(eff_z[i]), float(total_z[i]))
+        for i in top_by_yards(season, top_n)
+    ]
+    return TableModel(season_columns(season.year), rows)
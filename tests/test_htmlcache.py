@@ -0,0 +1,82 @@
+"""Page cache freshness (TTL) and least-recently-used eviction."""
+import os
+
+from nfldeepdive.htmlcache import RECENT_TTL, PageCache, season_final_time
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def cache_page(pages, year, text="<table id=\"passing\"></table>", etag=None):
+    with pages.writer(year) as writer:
+        writer.write(text)
+        writer.commit(f"https://example.test/years/{year}/passing.htm", etag)
+
+
+def set_last_used(pages, year, when):
+    os.utime(pages.meta_path(year), (when, when))
+
+
+def test_finished_season_is_fresh_and_current_season_expires(tmp_path):
+    in_progress = season_final_time(2024) - 30 * 24 * 3600
+    clock = Clock(in_progress)
+    pages = PageCache(str(tmp_path), clock=clock)
+    cache_page(pages, 2010)
+    cache_page(pages, 2024, etag='"v1"')
+
+    assert pages.is_fresh(2010) and pages.is_fresh(2024)
+    clock.now += RECENT_TTL + 1
+    assert pages.is_fresh(2010)
+    assert not pages.is_fresh(2024)
+    assert pages.validators(pages.meta(2024)) == {"If-None-Match": '"v1"'}
+
+    # A 304 counts as checked, which restarts the TTL
+    pages.mark_checked(2024)
+    assert pages.is_fresh(2024)
+
+    # Checked after the season ended: final from then on
+    clock.now = season_final_time(2024) + 1
+    pages.mark_checked(2024)
+    clock.now += 10 * RECENT_TTL
+    assert pages.is_fresh(2024)
+
+
+def test_season_without_a_page_is_fresh_only_once_final(tmp_path):
+    pages = PageCache(str(tmp_path), clock=Clock(season_final_time(2024) - 1))
+    assert pages.meta(2024) is None
+    assert pages.is_fresh(2010) and not pages.is_fresh(2024)
+
+
+def test_least_recently_used_pages_are_evicted_first(tmp_path):
+    pages = PageCache(str(tmp_path), max_bytes=None)
+    for year in (2001, 2002, 2003, 2004):
+        cache_page(pages, year, os.urandom(3000).hex())
+    for used, year in enumerate((2003, 2001, 2004, 2002)):
+        set_last_used(pages, year, 1_000_000 + used)
+    sizes = {year: size for _, size, year in pages.entries()}
+
+    # Reading a page makes it the most recently used
+    with pages.open_text(2003) as f:
+        f.read()
+    assert pages.evict(max_bytes=sizes[2002] + sizes[2003]) == [2001, 2004]
+    assert sorted(year for _, _, year in pages.entries()) == [2002, 2003]
+    assert not os.path.exists(pages.meta_path(2001))
+
+
+def test_commit_keeps_the_new_page_within_the_size_cap(tmp_path):
+    pages = PageCache(str(tmp_path), max_bytes=None)
+    cache_page(pages, 2001, os.urandom(3000).hex())
+    set_last_used(pages, 2001, 1_000_000)
+    pages.max_bytes = pages.total_size() + 100
+    cache_page(pages, 2002, os.urandom(3000).hex())
+    assert [year for _, _, year in pages.entries()] == [2002]
+
+    # The page just written is never the one evicted, even when it alone is over the cap
+    pages.max_bytes = 10
+    cache_page(pages, 2003, os.urandom(3000).hex())
+    assert [year for _, _, year in pages.entries()] == [2003]
@@ -0,0 +1,94 @@
+"""Incremental season updates against a full rebuild of the leaderboard index."""
+import math
+import random
+import statistics
+from array import array
+
+import pytest
+
+from nfldeepdive.leaderboard import LeaderboardIndex
+from nfldeepdive.live import RunningStats, update_index
+from nfldeepdive.season import NUMERIC_COLUMNS, Season
+
+
+def make_season(year, players, seed=0):
+    r = random.Random(seed)
+    columns = {"Player": [f"Passer {i}" for i in range(players)], "Team": [r.choice(("SFO", "GNB", "DAL"))
+                                                                          for _ in range(players)]}
+    for name in NUMERIC_COLUMNS:
+        columns[name] = array("d", (float(r.randint(1, 600)) for _ in range(players)))
+    # Some passers below the attempts minimum, and a blank stat or two
+    for i in range(0, players, 7):
+        columns["Att"][i] = float(r.randint(1, 99))
+    columns["TD"][3] = math.nan
+    return Season(year, columns)
+
+
+def copy_season(season):
+    return Season(season.year, {name: list(values) if isinstance(values, list) else array("d", values)
+                                for name, values in season.columns.items()})
+
+
+def drop_row(season, i):
+    for values in season.columns.values():
+        del values[i]
+
+
+def add_row(season, player, team, value):
+    for name, values in season.columns.items():
+        values.append(player if name == "Player" else team if name == "Team" else value)
+
+
+def test_running_stats_add_remove_replace():
+    values = [3.0, 7.5, math.nan, 12.0, 1.25, 9.0]
+    stats = RunningStats()
+    for x in values:
+        stats.add(x)
+    finite = [x for x in values if x == x]
+    assert stats.n == len(finite)
+    assert stats.mean == pytest.approx(statistics.fmean(finite))
+    assert stats.std() == pytest.approx(statistics.stdev(finite))
+
+    stats.remove(7.5)
+    stats.replace(12.0, 20.0)
+    finite = [3.0, 20.0, 1.25, 9.0]
+    assert stats.mean == pytest.approx(statistics.fmean(finite))
+    assert stats.std() == pytest.approx(statistics.stdev(finite))
+
+    for x in finite[:-1]:
+        stats.remove(x)
+    assert stats.n == 1 and math.isnan(stats.std())
+    stats.remove(9.0)
+    assert stats.as_tuple() == (0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("year", [1965, 2015])
+def test_update_index_matches_rebuild(tmp_path, year):
+    old = make_season(year, 60, seed=year)
+    incremental = LeaderboardIndex(str(tmp_path / "incremental"))
+    incremental.update_season(old)
+
+    new = copy_season(old)
+    cols = new.columns
+    cols["Yds"][1] += 250.0                  # changed
+    cols["Att"][0] = 150.0                   # joins the pool after 1970
+    cols["Att"][2] = 40.0                    # leaves it
+    cols["QBR"][4] = math.nan                # a stat goes blank
+    drop_row(new, 5)                         # removed
+    add_row(new, "New Passer", "SFO", 321.0)  # added
+
+    diff = update_index(incremental, old, new)
+    assert diff.added == ["New Passer"] and diff.removed == ["Passer 5"]
+
+    rebuilt = LeaderboardIndex(str(tmp_path / "rebuilt"))
+    rebuilt.update_season(new)
+
+    got, expected = incremental.season_scores(new), rebuilt.season_scores(new)
+    assert got is not None and expected is not None
+    for got_column, expected_column in zip(got, expected):
+        assert list(got_column) == pytest.approx(list(expected_column), nan_ok=True)
+
+    got_moments, expected_moments = incremental.season_moments(year), rebuilt.season_moments(year)
+    for metric, (n, mean, m2) in expected_moments.items():
+        assert got_moments[metric][0] == n
+        assert got_moments[metric][1:] == pytest.approx((mean, m2))
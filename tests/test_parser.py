@@ -0,0 +1,64 @@
+"""Streaming extraction of the passing table."""
+import pytest
+
+from benchmarks.fixtures import era_columns, passing_page
+from nfldeepdive.fetch import read_passing_table
+from nfldeepdive.parser import PassingTableParser
+
+PAGE = passing_page(2015, players=45, chrome_kb=8)
+TABLE_END = PAGE.index("</table>", PAGE.index('id="passing"'))
+
+
+def chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def parse(pieces):
+    table = PassingTableParser()
+    rows = []
+    for piece in pieces:
+        rows.extend(table.feed(piece))
+    return table, rows
+
+
+@pytest.mark.parametrize("size", [29, 1000, 64 * 1024, len(PAGE)])
+def test_rows_do_not_depend_on_how_the_page_is_chunked(size):
+    table, rows = parse(chunks(PAGE, size))
+    expected_table, expected = parse([PAGE])
+    assert table.found and table.done
+    assert rows == expected
+    assert table.header == expected_table.header == list(era_columns(2015))
+
+
+def test_repeated_header_rows_are_dropped():
+    _, rows = parse([PAGE])
+    # 45 passers, every 17th listed as a total plus two or three team rows
+    assert len(rows) == 45 + 2 + 3
+    assert all(row[1] != "player" and row[0].isdigit() for row in rows)
+    assert rows[0][1] == rows[0][1].strip() and "<" not in "".join(rows[0])
+
+
+def test_parsing_stops_at_the_end_of_the_table():
+    pulled = []
+
+    def stream():
+        for piece in chunks(PAGE, 1024):
+            pulled.append(piece)
+            yield piece
+
+    table, rows = read_passing_table(stream())
+    assert table.done and rows
+    assert len(pulled) == TABLE_END // 1024 + 1
+    assert table.feed("<table id=\"passing\"><tr><td>late</td></tr></table>") == []
+
+
+@pytest.mark.parametrize("cut", [TABLE_END - 500, TABLE_END])
+def test_a_page_cut_inside_the_table_is_found_but_not_done(cut):
+    table, rows = parse(chunks(PAGE[:cut], 4096))
+    assert table.found and not table.done
+    assert rows
+
+
+def test_a_page_cut_before_the_table_is_not_found():
+    table, rows = parse(chunks(PAGE[:PAGE.index('id="passing"')], 4096))
+    assert not table.found and not table.done and rows == []
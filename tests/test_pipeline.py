@@ -0,0 +1,68 @@
+"""Player rows from a parsed passing table, multi-team passers in particular."""
+import math
+
+import pytest
+
+from benchmarks.fixtures import era_columns, header_row, player_row
+from nfldeepdive.fetch import read_passing_table
+from nfldeepdive.pipeline import extract_players, season_from_table
+
+
+def stats(att, cmp_, yds, td, ints, g=8, gs=8, rating="90.0"):
+    return {
+        "g": str(g), "gs": str(gs), "pass_cmp": str(cmp_), "pass_att": str(att),
+        "pass_cmp_pct": f"{100 * cmp_ / att:.1f}", "pass_yds": str(yds), "pass_td": str(td), "pass_int": str(ints),
+        "pass_yds_per_att": f"{yds / att:.1f}", "pass_yds_per_g": f"{yds / g:.1f}", "pass_rating": rating,
+        "qbr": "55.0",
+    }
+
+
+def passing_table(year, rows):
+    """A bare passing table with one row per (name, team, stats), ranked in order"""
+    columns = era_columns(year)
+    body = "".join(player_row(columns, rank, name, f"Pass{rank:02d}", team, values)
+                   for rank, (name, team, values) in enumerate(rows, 1))
+    return f'<table id="passing"><thead>{header_row(columns)}</thead><tbody>{body}</tbody></table>'
+
+
+def players(year, rows):
+    table, parsed = read_passing_table([passing_table(year, rows)])
+    return extract_players(parsed, year, table.header)
+
+
+TEAM_A = stats(200, 120, 1500, 10, 5)
+TEAM_B = stats(150, 90, 1100, 6, 4)
+TOTAL = stats(350, 210, 2600, 16, 9, g=16, gs=16)
+COUNTING_STATS = {"G": "g", "Att": "pass_att", "Cmp": "pass_cmp", "Yds": "pass_yds", "TD": "pass_td", "INT": "pass_int"}
+
+
+@pytest.mark.parametrize("year", [1970, 1990, 2015])
+@pytest.mark.parametrize("total_first", [True, False])
+def test_multi_team_passer_is_one_row_with_the_totals(year, total_first):
+    teams = [("Joe Traded", "SFO", TEAM_A), ("Joe Traded", "DAL", TEAM_B)]
+    total = ("Joe Traded", "2TM", TOTAL)
+    rows = [("Dan Stays", "MIA", stats(400, 260, 3200, 24, 11))]
+    rows += [total] + teams if total_first else teams + [total]
+
+    found = players(year, rows)
+    assert [p.player for p in found] == ["Dan Stays*", "Joe Traded*"]
+    traded = found[1]
+    assert traded.team == "2TM" and traded.is_multi_team
+    for name, stat in COUNTING_STATS.items():
+        assert traded[name] == float(TEAM_A[stat]) + float(TEAM_B[stat])
+
+
+def test_first_single_team_row_is_kept_without_a_total():
+    found = players(1990, [("Joe Traded", "SFO", TEAM_A), ("Joe Traded", "DAL", TEAM_B)])
+    assert len(found) == 1
+    assert found[0].team == "SFO" and found[0]["Att"] == 200
+
+
+def test_every_passer_is_kept_and_qbr_only_from_2006():
+    rows = [("Few Throws", "NYG", stats(12, 6, 80, 0, 1)), ("Many Throws", "NYJ", TEAM_A)]
+    old = season_from_table(*read_passing_table([passing_table(1990, rows)]), 1990)
+    new = season_from_table(*read_passing_table([passing_table(2015, rows)]), 2015)
+    assert len(old) == len(new) == 2
+    assert old.qualifying() == new.qualifying() == [False, True]
+    assert all(math.isnan(v) for v in old.columns["QBR"])
+    assert list(new.columns["QBR"]) == [55.0, 55.0]
@@ -0,0 +1,55 @@
+"""Era layouts and header detection for the passing table columns."""
+import math
+
+import pytest
+
+from benchmarks.fixtures import era_columns
+from nfldeepdive.schema import MIN_CELLS, compile_extractor, schema_for_year
+
+
+def row_for(header, values):
+    """Cells in ``header`` order, taken from ``values`` by data-stat name"""
+    return tuple(values.get(stat, "") for stat in header)
+
+
+VALUES = {
+    "ranker": "1", "player": "Joe Passer", "team": "SFO", "g": "16", "gs": "15", "pass_cmp": "300",
+    "pass_att": "450", "pass_cmp_pct": "66.7", "pass_yds": "3,600", "pass_td": "28", "pass_int": "9",
+    "pass_yds_per_att": "8.0", "pass_yds_per_g": "225.0", "pass_rating": "101.2", "qbr": "61.5",
+}
+
+
+@pytest.mark.parametrize("year", [1965, 1977, 1978, 2005, 2006, 2020])
+def test_detected_positions_match_the_era_table(year):
+    header = era_columns(year)
+    extract = compile_extractor(year, header)
+    assert extract.schema is schema_for_year(year)
+    assert extract.positions == extract.schema.positions
+
+
+@pytest.mark.parametrize("year", [1990, 2015])
+def test_a_shifted_column_is_found_from_the_header(year):
+    header = list(era_columns(year))
+    header.insert(header.index("team") + 1, "awards")
+    record = compile_extractor(year, header)(row_for(header, dict(VALUES, awards="PB")))
+    assert (record.player, record.team) == ("Joe Passer", "SFO")
+    assert record["Att"] == 450 and record["Yds"] == 3600 and record["Rate"] == 101.2
+    assert record["QBR"] == 61.5 if year >= 2006 else math.isnan(record["QBR"])
+
+
+def test_newer_data_stat_names_are_recognized():
+    header = [{"player": "name_display", "team": "team_name_abbr", "pass_cmp_pct": "pass_cmp_perc"}.get(s, s)
+              for s in era_columns(2015)]
+    values = dict(VALUES, name_display="Joe Passer", team_name_abbr="SFO", pass_cmp_perc="66.7")
+    record = compile_extractor(2015, header)(row_for(header, values))
+    assert (record.player, record.team, record["Cmp%"]) == ("Joe Passer", "SFO", 66.7)
+
+
+@pytest.mark.parametrize("header", [None, (), ("ranker", "player", "team", "mystery")])
+def test_missing_or_unknown_header_falls_back_to_the_era_table(header):
+    extract = compile_extractor(1990, header)
+    assert extract.positions == schema_for_year(1990).positions
+    assert extract.min_cells == MIN_CELLS
+    record = extract(row_for(era_columns(1990), VALUES))
+    assert record["Att"] == 450 and record["Y/G"] == 225.0 and math.isnan(record["QBR"])
+
@@ -0,0 +1,33 @@
+"""What-if scoring with the default weights against the leaderboard's Total Z-Score."""
+import pytest
+
+from benchmarks.fixtures import passing_page
+from nfldeepdive.fetch import read_passing_table
+from nfldeepdive.leaderboard import RESULT_COLUMNS, LeaderboardIndex
+from nfldeepdive.pipeline import season_from_table
+from nfldeepdive.scoring import ScoringEngine
+from nfldeepdive.season import MIN_ATTEMPTS
+
+YEARS = (1965, 1970, 1971, 1995, 2015)
+
+
+@pytest.fixture(scope="module")
+def seasons():
+    seasons = []
+    for year in YEARS:
+        table, rows = read_passing_table([passing_page(year, players=60, chrome_kb=1)])
+        seasons.append(season_from_table(table, rows, year))
+    return seasons
+
+
+@pytest.mark.parametrize("year", YEARS)
+def test_default_weights_rank_like_total_z(tmp_path, seasons, year):
+    index = LeaderboardIndex(str(tmp_path))
+    index.update_seasons(seasons)
+    engine = ScoringEngine(seasons)
+
+    expected = index.top(1000, start=year, end=year)
+    got = engine.rank(min_attempts=MIN_ATTEMPTS, top_n=1000, years=[year])
+    assert expected
+    assert [(row[1], row[2]) for row in got] == [(row[1], row[2]) for row in expected]
+    assert [row[-1] for row in got] == pytest.approx([row[RESULT_COLUMNS.index("total_z")] for row in expected])
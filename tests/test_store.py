@@ -0,0 +1,57 @@
+"""Binary parsed-season cache."""
+import math
+import os
+from array import array
+
+import pytest
+
+from nfldeepdive.season import COLUMNS, NUMERIC_COLUMNS, Season
+from nfldeepdive.store import SeasonStore, decode_season, encode_season
+
+
+def make_season(year, names):
+    """Every stat filled in except QBR and the first passer's Rate, which are blank"""
+    columns = {"Player": list(names), "Team": ["SFO", "2TM", "NOR"][:len(names)]}
+    for i, name in enumerate(NUMERIC_COLUMNS):
+        columns[name] = array("d", (float(i * 10 + row) for row in range(len(names))))
+    columns["QBR"] = array("d", [math.nan] * len(names))
+    if names:
+        columns["Rate"][0] = math.nan
+    return Season(year, columns)
+
+
+def assert_same(got, expected):
+    assert got.year == expected.year and len(got) == len(expected)
+    for name in COLUMNS:
+        assert list(got.columns[name]) == pytest.approx(list(expected.columns[name]), nan_ok=True)
+
+
+@pytest.mark.parametrize("names", [
+    ["Joe Montana*", "Søren Ödegård+", "D'Brickashaw “QB” Jr."],
+    ["Only One"],
+    [],
+])
+def test_encode_decode_round_trip(names):
+    season = make_season(1990, names)
+    assert_same(decode_season(encode_season(season), 1990), season)
+
+
+def test_store_saves_loads_and_rejects_damaged_files(tmp_path):
+    store = SeasonStore(str(tmp_path))
+    season = make_season(2015, ["Joe Montana*", "Dan Marino"])
+    old = os.path.join(store.directory, "passing_2015.v1.bin")
+    os.makedirs(store.directory)
+    open(old, "wb").close()
+
+    store.save(season)
+    assert store.years() == [2015]
+    assert not os.path.exists(old)
+    assert_same(store.load(2015), season)
+    assert store.load(2014) is None
+
+    data = encode_season(season)
+    with open(store.path(2015), "wb") as f:
+        f.write(data[:-8])
+    assert store.load(2015) is None
+    with pytest.raises(ValueError):
+        decode_season(data, 2014)